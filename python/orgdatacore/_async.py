@@ -19,12 +19,21 @@ Example:
 import asyncio
 import inspect
 import json
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from io import BytesIO
 from typing import Any, BinaryIO
 
 from ._exceptions import ConfigurationError, DataLoadError, GCSError
+from ._hierarchy import (
+    HierarchyIndex,
+    build_hierarchy_index,
+    get_descendants_tree,
+    get_hierarchy_path,
+    get_user_org_names,
+    get_user_organizations,
+)
 from ._log import get_logger
 from ._service import _normalize_slack_channel, parse_data
 from ._types import (
@@ -44,7 +53,6 @@ from ._types import (
     MembershipType,
     Org,
     OrgInfo,
-    OrgInfoType,
     Pillar,
     Team,
     TeamGroup,
@@ -57,12 +65,52 @@ DEFAULT_MAX_RETRIES = 3
 DEFAULT_RETRY_DELAY = 1.0
 DEFAULT_RETRY_BACKOFF = 2.0
 
+_NO_VERSION = DataVersion()
+
+
+@dataclass(frozen=True, slots=True)
+class _Snapshot:
+    """Immutable view of one loaded dataset and the indexes derived from it.
+
+    A new snapshot is built for every load and published with a single
+    attribute assignment, so readers always see a consistent dataset
+    without taking the lock.
+    """
+
+    data: Data
+    version: DataVersion
+    # Direct references into data, so lookups skip the attribute chain
+    employees: Mapping[str, Employee]
+    teams: Mapping[str, Team]
+    orgs: Mapping[str, Org]
+    pillars: Mapping[str, Pillar]
+    team_groups: Mapping[str, TeamGroup]
+    components: Mapping[str, Component]
+    slack_uid_to_uid: Mapping[str, str]
+    github_id_to_uid: Mapping[str, str]
+    membership_index: Mapping[str, tuple[MembershipInfo, ...]]
+    component_owners: Mapping[str, tuple[ComponentOwnerInfo, ...]]
+    jira_project_component_owners: Mapping[str, Mapping[str, tuple[JiraOwnerInfo, ...]]]
+    # Derived indexes
+    hierarchy: HierarchyIndex
+    slack_channel_index: Mapping[str, tuple[str, ...]]
+    teams_by_user: Mapping[str, tuple[str, ...]]
+    orgs_by_user: Mapping[str, tuple[OrgInfo, ...]]
+    all_employees: tuple[Employee, ...]
+    all_teams: tuple[Team, ...]
+    all_orgs: tuple[Org, ...]
+    all_pillars: tuple[Pillar, ...]
+    all_team_groups: tuple[TeamGroup, ...]
+    all_components: tuple[Component, ...]
+
 
 class AsyncService:
     """Async implementation of the organizational data service.
 
     Thread-safe and asyncio-compatible. All lookup methods are async
-    to allow for non-blocking operation in async contexts.
+    to allow for non-blocking operation in async contexts. Lookups read
+    the current immutable snapshot and never take the lock; the lock only
+    serializes loads, which publish a new snapshot in a single assignment.
 
     Example:
         service = AsyncService()
@@ -70,6 +118,15 @@ class AsyncService:
         employee = await service.get_employee_by_uid("jdoe")
     """
 
+    __slots__ = (
+        "_lock",
+        "_snapshot",
+        "_init_source",
+        "_watcher_running",
+        "_watcher_task",
+        "_watcher_source",
+    )
+
     def __init__(self, *, data_source: Any | None = None) -> None:
         """Initialize a new async organizational data service.
 
@@ -77,13 +134,11 @@ class AsyncService:
             data_source: Optional async data source to load from immediately.
         """
         self._lock = asyncio.Lock()
-        self._data: Data | None = None
-        self._version = DataVersion()
+        self._snapshot: _Snapshot | None = None
         self._init_source = data_source
         self._watcher_running = False
         self._watcher_task: asyncio.Task[None] | None = None
         self._watcher_source: Any | None = None
-        self._slack_channel_index: dict[str, list[str]] = {}
 
     async def initialize(self) -> None:
         """Initialize the service if a data source was provided.
@@ -96,21 +151,34 @@ class AsyncService:
     async def load_from_data_source(self, source: Any) -> None:
         """Load organizational data from an async data source.
 
+        JSON decoding, validation and index building are CPU-bound, so they
+        run in a worker thread to keep the event loop responsive while a
+        large dataset loads.
+
+        Concurrent loads are serialized, so a slow load can never publish
+        its data over a newer one. Lookups are not blocked while loading.
+
         Args:
-            source: Async data source with an async load() method.
+            source: Async data source with an async load() method. load() may
+                return a binary file-like object or the raw JSON bytes.
 
         Raises:
             DataLoadError: If loading or parsing fails.
         """
+        async with self._lock:
+            await self._load_from_data_source(source)
+
+    async def _load_from_data_source(self, source: Any) -> None:
+        """Internal: Load and publish a new snapshot. Caller must hold lock."""
         logger = get_logger()
         logger.debug("Loading data from async source", extra={"source": str(source)})
 
         try:
             # Support both sync and async data sources
             if inspect.iscoroutinefunction(source.load):
-                reader = await source.load()
+                payload = await source.load()
             else:
-                reader = await asyncio.to_thread(source.load)
+                payload = await asyncio.to_thread(source.load)
         except Exception as e:
             logger.error(
                 "Failed to load from async data source",
@@ -119,10 +187,16 @@ class AsyncService:
             raise DataLoadError(f"failed to load from data source {source}: {e}") from e
 
         try:
-            content = reader.read()
-            if isinstance(content, bytes):
-                content = content.decode("utf-8")
-            raw_data = json.loads(content)
+            if isinstance(payload, (bytes, bytearray)):
+                content = payload
+            elif isinstance(payload, memoryview):
+                content = payload.tobytes()
+            else:
+                try:
+                    content = payload.read()
+                finally:
+                    payload.close()
+            raw_data = await asyncio.to_thread(json.loads, content)
         except json.JSONDecodeError as e:
             logger.error(
                 "Failed to parse JSON", extra={"source": str(source), "error": str(e)}
@@ -130,11 +204,9 @@ class AsyncService:
             raise DataLoadError(
                 f"failed to parse JSON from source {source}: {e}"
             ) from e
-        finally:
-            reader.close()
 
         try:
-            org_data = parse_data(raw_data)
+            org_data = await asyncio.to_thread(parse_data, raw_data)
         except Exception as e:
             logger.error(
                 "Failed to parse data structure",
@@ -144,32 +216,76 @@ class AsyncService:
                 f"failed to parse data structure from source {source}: {e}"
             ) from e
 
-        async with self._lock:
-            self._data = org_data
-            self._version = DataVersion(
-                load_time=datetime.now(),
-                org_count=len(org_data.lookups.orgs),
-                employee_count=len(org_data.lookups.employees),
-            )
+        version = DataVersion(
+            load_time=datetime.now(),
+            org_count=len(org_data.lookups.orgs),
+            employee_count=len(org_data.lookups.employees),
+        )
+        snapshot = await asyncio.to_thread(self._build_snapshot, org_data, version)
 
-            self._slack_channel_index = {}
-            for team in org_data.lookups.teams.values():
-                if team.group.slack is None:
-                    continue
-                for ch in team.group.slack.channels:
-                    if ch.channel:
-                        normalized = _normalize_slack_channel(ch.channel)
-                        self._slack_channel_index.setdefault(normalized, []).append(team.name)
+        # A single attribute store: readers see either the old snapshot or
+        # the new one, never a partially built state.
+        self._snapshot = snapshot
 
         logger.info(
             "Data loaded successfully (async)",
             extra={
                 "source": str(source),
-                "employee_count": self._version.employee_count,
-                "org_count": self._version.org_count,
+                "employee_count": version.employee_count,
+                "org_count": version.org_count,
             },
         )
 
+    @classmethod
+    def _build_snapshot(cls, data: Data, version: DataVersion) -> _Snapshot:
+        """Build a snapshot and its derived indexes for freshly parsed data."""
+        slack_channel_index: dict[str, list[str]] = {}
+        for team in data.lookups.teams.values():
+            if team.group.slack is None:
+                continue
+            for ch in team.group.slack.channels:
+                if ch.channel:
+                    normalized = _normalize_slack_channel(ch.channel)
+                    slack_channel_index.setdefault(normalized, []).append(team.name)
+
+        hierarchy = build_hierarchy_index(data)
+        teams_by_user: dict[str, tuple[str, ...]] = {}
+        orgs_by_user: dict[str, tuple[OrgInfo, ...]] = {}
+
+        for uid, memberships in data.indexes.membership.membership_index.items():
+            teams_by_user[uid] = tuple(
+                m.name for m in memberships if m.type == MembershipType.TEAM
+            )
+            orgs_by_user[uid] = tuple(get_user_organizations(hierarchy, memberships))
+
+        return _Snapshot(
+            data=data,
+            version=version,
+            employees=data.lookups.employees,
+            teams=data.lookups.teams,
+            orgs=data.lookups.orgs,
+            pillars=data.lookups.pillars,
+            team_groups=data.lookups.team_groups,
+            components=data.lookups.components,
+            slack_uid_to_uid=data.indexes.slack_id_mappings.slack_uid_to_uid,
+            github_id_to_uid=data.indexes.github_id_mappings.github_id_to_uid,
+            membership_index=data.indexes.membership.membership_index,
+            component_owners=data.indexes.component_ownership.component_owners,
+            jira_project_component_owners=data.indexes.jira.project_component_owners,
+            hierarchy=hierarchy,
+            slack_channel_index={
+                channel: tuple(names) for channel, names in slack_channel_index.items()
+            },
+            teams_by_user=teams_by_user,
+            orgs_by_user=orgs_by_user,
+            all_employees=tuple(data.lookups.employees.values()),
+            all_teams=tuple(data.lookups.teams.values()),
+            all_orgs=tuple(data.lookups.orgs.values()),
+            all_pillars=tuple(data.lookups.pillars.values()),
+            all_team_groups=tuple(data.lookups.team_groups.values()),
+            all_components=tuple(data.lookups.components.values()),
+        )
+
     async def start_data_source_watcher(self, source: Any) -> None:
         """Start watching an async data source for changes.
 
@@ -277,13 +393,14 @@ class AsyncService:
 
     def is_healthy(self) -> bool:
         """Check if the service has data loaded."""
-        return self._data is not None
+        return self._snapshot is not None
 
     def is_ready(self) -> bool:
         """Check if the service is ready to serve requests."""
-        if self._data is None:
+        snapshot = self._snapshot
+        if snapshot is None:
             return False
-        return bool(self._data.lookups.employees) or self._data.metadata.pii_free
+        return bool(snapshot.employees) or snapshot.data.metadata.pii_free
 
     def get_data_age(self) -> timedelta:
         """Get the duration since data was last loaded.
@@ -291,9 +408,10 @@ class AsyncService:
         Returns:
             timedelta since last load, or timedelta(0) if no data loaded.
         """
-        if self._version.load_time == datetime.min:
+        version = self.get_version()
+        if version.load_time == datetime.min:
             return timedelta(0)
-        return datetime.now() - self._version.load_time
+        return datetime.now() - version.load_time
 
     def is_data_stale(self, max_age: timedelta) -> bool:
         """Check if data is older than max_age, or if no data is loaded.
@@ -306,55 +424,56 @@ class AsyncService:
         Returns:
             True if data is stale or not loaded, False otherwise.
         """
-        if self._data is None or self._version.load_time == datetime.min:
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.version.load_time == datetime.min:
             return True
-        return (datetime.now() - self._version.load_time) > max_age
+        return (datetime.now() - snapshot.version.load_time) > max_age
 
     # Async lookup methods
 
     async def get_employee_by_uid(self, uid: str) -> Employee | None:
         """Get an employee by their UID."""
-        async with self._lock:
-            if self._data is None:
-                return None
-            return self._data.lookups.employees.get(uid)
+        snapshot = self._snapshot
+        if snapshot is None:
+            return None
+        return snapshot.employees.get(uid)
 
     async def get_employee_by_email(self, email: str) -> Employee | None:
         """Get an employee by their email address."""
-        async with self._lock:
-            if self._data is None:
-                return None
-            for emp in self._data.lookups.employees.values():
-                if emp.email.lower() == email.lower():
-                    return emp
+        snapshot = self._snapshot
+        if snapshot is None:
             return None
+        for emp in snapshot.employees.values():
+            if emp.email.lower() == email.lower():
+                return emp
+        return None
 
     async def get_employee_by_slack_id(self, slack_id: str) -> Employee | None:
         """Get an employee by their Slack ID."""
-        async with self._lock:
-            if self._data is None:
-                return None
-            uid = self._data.indexes.slack_id_mappings.slack_uid_to_uid.get(slack_id)
-            if uid:
-                return self._data.lookups.employees.get(uid)
+        snapshot = self._snapshot
+        if snapshot is None:
             return None
+        uid = snapshot.slack_uid_to_uid.get(slack_id)
+        if uid:
+            return snapshot.employees.get(uid)
+        return None
 
     async def get_employee_by_github_id(self, github_id: str) -> Employee | None:
         """Get an employee by their GitHub ID."""
-        async with self._lock:
-            if self._data is None:
-                return None
-            uid = self._data.indexes.github_id_mappings.github_id_to_uid.get(github_id)
-            if uid:
-                return self._data.lookups.employees.get(uid)
+        snapshot = self._snapshot
+        if snapshot is None:
             return None
+        uid = snapshot.github_id_to_uid.get(github_id)
+        if uid:
+            return snapshot.employees.get(uid)
+        return None
 
     async def get_team_by_name(self, team_name: str) -> Team | None:
         """Get a team by name."""
-        async with self._lock:
-            if self._data is None:
-                return None
-            return self._data.lookups.teams.get(team_name)
+        snapshot = self._snapshot
+        if snapshot is None:
+            return None
+        return snapshot.teams.get(team_name)
 
     async def get_teams_by_slack_channel(self, channel: str) -> list[Team]:
         """Get teams associated with a Slack channel name.
@@ -366,18 +485,14 @@ class AsyncService:
         Returns:
             List of matching teams, or empty list if none found.
         """
-        async with self._lock:
-            if self._data is None or not channel:
-                return []
+        snapshot = self._snapshot
+        if snapshot is None or not channel:
+            return []
 
-            team_names = self._slack_channel_index.get(
-                _normalize_slack_channel(channel), []
-            )
-            return [
-                self._data.lookups.teams[name]
-                for name in team_names
-                if name in self._data.lookups.teams
-            ]
+        team_names = snapshot.slack_channel_index.get(
+            _normalize_slack_channel(channel), ()
+        )
+        return [snapshot.teams[name] for name in team_names if name in snapshot.teams]
 
     async def get_team_escalation(self, team_name: str) -> list[EscalationContactInfo]:
         """Get the escalation contacts for a team.
@@ -389,173 +504,147 @@ class AsyncService:
             Ordered list of escalation contacts, or empty list if team
             not found or has no escalation data.
         """
-        async with self._lock:
-            if self._data is None or not self._data.lookups.teams:
-                return []
-            team = self._data.lookups.teams.get(team_name)
-            if team is None:
-                return []
-            return list(team.group.escalation)
+        snapshot = self._snapshot
+        if snapshot is None or not snapshot.teams:
+            return []
+        team = snapshot.teams.get(team_name)
+        if team is None:
+            return []
+        return list(team.group.escalation)
 
     async def get_org_by_name(self, org_name: str) -> Org | None:
         """Get an organization by name."""
-        async with self._lock:
-            if self._data is None:
-                return None
-            return self._data.lookups.orgs.get(org_name)
+        snapshot = self._snapshot
+        if snapshot is None:
+            return None
+        return snapshot.orgs.get(org_name)
 
     async def get_pillar_by_name(self, pillar_name: str) -> Pillar | None:
         """Get a pillar by name."""
-        async with self._lock:
-            if self._data is None:
-                return None
-            return self._data.lookups.pillars.get(pillar_name)
+        snapshot = self._snapshot
+        if snapshot is None:
+            return None
+        return snapshot.pillars.get(pillar_name)
 
     async def get_team_group_by_name(self, team_group_name: str) -> TeamGroup | None:
         """Get a team group by name."""
-        async with self._lock:
-            if self._data is None:
-                return None
-            return self._data.lookups.team_groups.get(team_group_name)
+        snapshot = self._snapshot
+        if snapshot is None:
+            return None
+        return snapshot.team_groups.get(team_group_name)
 
     async def get_component_by_name(self, component_name: str) -> Component | None:
         """Get a component by name."""
-        async with self._lock:
-            if self._data is None:
-                return None
-            return self._data.lookups.components.get(component_name)
+        snapshot = self._snapshot
+        if snapshot is None:
+            return None
+        return snapshot.components.get(component_name)
 
     async def get_user_memberships(self, uid: str) -> list[MembershipInfo]:
         """Get all memberships for a user."""
-        async with self._lock:
-            if self._data is None:
-                return []
-            return list(self._data.indexes.membership.membership_index.get(uid, ()))
+        snapshot = self._snapshot
+        if snapshot is None:
+            return []
+        return list(snapshot.membership_index.get(uid, ()))
 
     async def get_user_teams(self, uid: str) -> list[str]:
         """Get team names for a user."""
-        memberships = await self.get_user_memberships(uid)
-        return [m.name for m in memberships if m.type == MembershipType.TEAM]
+        snapshot = self._snapshot
+        if snapshot is None:
+            return []
+        return list(snapshot.teams_by_user.get(uid, ()))
 
     async def get_teams_for_uid(self, uid: str) -> list[str]:
         """Get all teams a UID is a member of."""
-        return await self.get_user_teams(uid)
+        snapshot = self._snapshot
+        if snapshot is None:
+            return []
+        return list(snapshot.teams_by_user.get(uid, ()))
 
     async def get_teams_for_slack_id(self, slack_id: str) -> list[str]:
         """Get all teams a Slack user is a member of."""
-        uid = await self._get_uid_from_slack_id(slack_id)
+        snapshot = self._snapshot
+        if snapshot is None:
+            return []
+        uid = snapshot.slack_uid_to_uid.get(slack_id, "")
         if not uid:
             return []
-        return await self.get_teams_for_uid(uid)
-
-    async def _get_uid_from_slack_id(self, slack_id: str) -> str:
-        """Get the UID for a given Slack ID."""
-        async with self._lock:
-            if self._data is None:
-                return ""
-            return self._data.indexes.slack_id_mappings.slack_uid_to_uid.get(
-                slack_id, ""
-            )
+        return list(snapshot.teams_by_user.get(uid, ()))
 
     async def get_manager_for_employee(self, uid: str) -> Employee | None:
         """Get the manager for a given employee UID."""
-        async with self._lock:
-            if self._data is None:
-                return None
-            emp = self._data.lookups.employees.get(uid)
-            if not emp or not emp.manager_uid:
-                return None
-            return self._data.lookups.employees.get(emp.manager_uid)
+        snapshot = self._snapshot
+        if snapshot is None:
+            return None
+        emp = snapshot.employees.get(uid)
+        if not emp or not emp.manager_uid:
+            return None
+        return snapshot.employees.get(emp.manager_uid)
 
     async def is_employee_in_team(self, uid: str, team_name: str) -> bool:
         """Check if an employee is in a specific team."""
-        teams = await self.get_teams_for_uid(uid)
-        return team_name in teams
+        snapshot = self._snapshot
+        if snapshot is None:
+            return False
+        return team_name in snapshot.teams_by_user.get(uid, ())
 
     async def is_slack_user_in_team(self, slack_id: str, team_name: str) -> bool:
         """Check if a Slack user is in a specific team."""
-        uid = await self._get_uid_from_slack_id(slack_id)
+        snapshot = self._snapshot
+        if snapshot is None:
+            return False
+        uid = snapshot.slack_uid_to_uid.get(slack_id, "")
         if not uid:
             return False
-        return await self.is_employee_in_team(uid, team_name)
+        return team_name in snapshot.teams_by_user.get(uid, ())
 
     async def is_employee_in_org(self, uid: str, org_name: str) -> bool:
         """Check if an employee is in a specific organization."""
-        async with self._lock:
-            if self._data is None:
-                return False
-
-            memberships = self._data.indexes.membership.membership_index.get(uid, ())
-
-            for membership in memberships:
-                if (
-                    membership.type == MembershipType.ORG
-                    and membership.name == org_name
-                ):
-                    return True
-                elif membership.type == MembershipType.TEAM:
-                    hierarchy_path = self._get_hierarchy_path(membership.name, "team")
-                    for entry in hierarchy_path:
-                        if entry.type == "org" and entry.name == org_name:
-                            return True
-
+        snapshot = self._snapshot
+        if snapshot is None:
             return False
+        return self._is_employee_in_org(snapshot, uid, org_name)
 
     async def is_slack_user_in_org(self, slack_id: str, org_name: str) -> bool:
         """Check if a Slack user is in a specific organization."""
-        uid = await self._get_uid_from_slack_id(slack_id)
+        snapshot = self._snapshot
+        if snapshot is None:
+            return False
+        uid = snapshot.slack_uid_to_uid.get(slack_id, "")
         if not uid:
             return False
-        return await self.is_employee_in_org(uid, org_name)
+        return self._is_employee_in_org(snapshot, uid, org_name)
+
+    @staticmethod
+    def _is_employee_in_org(snapshot: _Snapshot, uid: str, org_name: str) -> bool:
+        """Check org membership directly or through a team's hierarchy."""
+        memberships = snapshot.membership_index.get(uid, ())
+        if not memberships:
+            return False
+        return org_name in get_user_org_names(snapshot.hierarchy, uid, memberships)
 
+    @staticmethod
     def _get_entity_by_type(
-        self, entity_name: str, entity_type: str
+        data: Data, entity_name: str, entity_type: str
     ) -> Team | Org | Pillar | TeamGroup | None:
         """Get entity from lookups by name and type."""
-        if self._data is None:
-            return None
         entity_type_lower = entity_type.lower()
         if entity_type_lower == "team":
-            return self._data.lookups.teams.get(entity_name)
+            return data.lookups.teams.get(entity_name)
         elif entity_type_lower == "org":
-            return self._data.lookups.orgs.get(entity_name)
+            return data.lookups.orgs.get(entity_name)
         elif entity_type_lower == "pillar":
-            return self._data.lookups.pillars.get(entity_name)
+            return data.lookups.pillars.get(entity_name)
         elif entity_type_lower == "team_group":
-            return self._data.lookups.team_groups.get(entity_name)
+            return data.lookups.team_groups.get(entity_name)
         return None
 
-    def _get_hierarchy_path(
-        self, entity_name: str, entity_type: str
-    ) -> list[HierarchyPathEntry]:
-        """Compute hierarchy path by walking parent references."""
-        if self._data is None:
-            return []
-
-        entity = self._get_entity_by_type(entity_name, entity_type)
-        if entity is None:
-            return []
-
-        path = [HierarchyPathEntry(name=entity_name, type=entity_type)]
-        visited = {entity_name}
-        current: Team | Org | Pillar | TeamGroup | None = entity
-
-        while current and current.parent:
-            parent = current.parent
-            if parent.name in visited:
-                break
-            visited.add(parent.name)
-            path.append(HierarchyPathEntry(name=parent.name, type=parent.type))
-            current = self._get_entity_by_type(parent.name, parent.type)
-
-        return path
-
     async def get_hierarchy_path(
         self, entity_name: str, entity_type: str = "team"
     ) -> list[HierarchyPathEntry]:
         """Get ordered hierarchy path from entity to root.
 
-        Computes path by walking parent references in entities.
+        Paths are precomputed when each snapshot is built.
 
         Args:
             entity_name: Name of the team/org/pillar/team_group
@@ -564,13 +653,15 @@ class AsyncService:
         Returns:
             Ordered list from entity to root. Empty list if not found.
         """
-        async with self._lock:
-            return self._get_hierarchy_path(entity_name, entity_type)
+        snapshot = self._snapshot
+        if snapshot is None:
+            return []
+        return get_hierarchy_path(snapshot.hierarchy, entity_name, entity_type)
 
     async def get_descendants_tree(self, entity_name: str) -> HierarchyNode | None:
         """Get all descendants of an entity as a nested tree.
 
-        Computes tree by scanning all entities for children.
+        Trees are built once per root entity and snapshot.
 
         Args:
             entity_name: Name of the org/pillar/team_group/team
@@ -578,155 +669,69 @@ class AsyncService:
         Returns:
             Nested tree structure with all descendants, or None if not found.
         """
-        async with self._lock:
-            if self._data is None:
-                return None
-
-            # Look up entity type
-            entity_type = ""
-            if entity_name in self._data.lookups.teams:
-                entity_type = "team"
-            elif entity_name in self._data.lookups.orgs:
-                entity_type = "org"
-            elif entity_name in self._data.lookups.pillars:
-                entity_type = "pillar"
-            elif entity_name in self._data.lookups.team_groups:
-                entity_type = "team_group"
-
-            if not entity_type:
-                return None
-
-            # Build children map by scanning all entities
-            children_map: dict[str, list[tuple[str, str]]] = {}
-            all_entities: list[tuple[str, Team | Org | Pillar | TeamGroup, str]] = [
-                *(
-                    (name, info, "team")
-                    for name, info in self._data.lookups.teams.items()
-                ),
-                *(
-                    (name, info, "org")
-                    for name, info in self._data.lookups.orgs.items()
-                ),
-                *(
-                    (name, info, "pillar")
-                    for name, info in self._data.lookups.pillars.items()
-                ),
-                *(
-                    (name, info, "team_group")
-                    for name, info in self._data.lookups.team_groups.items()
-                ),
-            ]
-
-            for name, info, etype in all_entities:
-                if info.parent:
-                    if info.parent.name not in children_map:
-                        children_map[info.parent.name] = []
-                    children_map[info.parent.name].append((name, etype))
-
-            def build_node(name: str, type_: str, visited: set[str]) -> HierarchyNode:
-                if name in visited:
-                    return HierarchyNode(name=name, type=type_, children=())
-                visited.add(name)
-                children = children_map.get(name, [])
-                child_nodes = tuple(build_node(n, t, visited) for n, t in children)
-                return HierarchyNode(name=name, type=type_, children=child_nodes)
-
-            return build_node(entity_name, entity_type, set())
+        snapshot = self._snapshot
+        if snapshot is None:
+            return None
+        return get_descendants_tree(snapshot.hierarchy, entity_name)
 
     async def get_user_organizations(self, slack_user_id: str) -> list[OrgInfo]:
         """Get the complete organizational hierarchy a Slack user belongs to."""
-        async with self._lock:
-            if self._data is None or not self._data.indexes.membership.membership_index:
-                return []
-
-            uid = self._data.indexes.slack_id_mappings.slack_uid_to_uid.get(
-                slack_user_id, ""
-            )
-            if not uid:
-                return []
-
-            memberships = self._data.indexes.membership.membership_index.get(uid, ())
-            result: list[OrgInfo] = []
-            seen: set[str] = set()
-
-            type_to_org_info_type = {
-                "org": OrgInfoType.ORGANIZATION,
-                "pillar": OrgInfoType.PILLAR,
-                "team_group": OrgInfoType.TEAM_GROUP,
-                "team": OrgInfoType.PARENT_TEAM,
-            }
-
-            for m in memberships:
-                if m.type == MembershipType.ORG:
-                    if m.name not in seen:
-                        result.append(
-                            OrgInfo(name=m.name, type=OrgInfoType.ORGANIZATION)
-                        )
-                        seen.add(m.name)
-                elif m.type == MembershipType.TEAM:
-                    if m.name not in seen:
-                        result.append(OrgInfo(name=m.name, type=OrgInfoType.TEAM))
-                        seen.add(m.name)
-
-                    hierarchy_path = self._get_hierarchy_path(m.name, "team")
-                    for entry in hierarchy_path[1:]:
-                        if entry.name not in seen:
-                            org_type = type_to_org_info_type.get(
-                                entry.type.lower(), OrgInfoType.ORGANIZATION
-                            )
-                            result.append(OrgInfo(name=entry.name, type=org_type))
-                            seen.add(entry.name)
-
-            return result
+        snapshot = self._snapshot
+        if snapshot is None:
+            return []
+        uid = snapshot.slack_uid_to_uid.get(slack_user_id, "")
+        if not uid:
+            return []
+        return list(snapshot.orgs_by_user.get(uid, ()))
 
     async def get_all_employees(self) -> list[Employee]:
         """Get all employees."""
-        async with self._lock:
-            if self._data is None:
-                return []
-            return list(self._data.lookups.employees.values())
+        snapshot = self._snapshot
+        if snapshot is None:
+            return []
+        return list(snapshot.all_employees)
 
     async def get_all_teams(self) -> list[Team]:
         """Get all teams."""
-        async with self._lock:
-            if self._data is None:
-                return []
-            return list(self._data.lookups.teams.values())
+        snapshot = self._snapshot
+        if snapshot is None:
+            return []
+        return list(snapshot.all_teams)
 
     async def get_all_orgs(self) -> list[Org]:
         """Get all organizations."""
-        async with self._lock:
-            if self._data is None:
-                return []
-            return list(self._data.lookups.orgs.values())
+        snapshot = self._snapshot
+        if snapshot is None:
+            return []
+        return list(snapshot.all_orgs)
 
     async def get_all_pillars(self) -> list[Pillar]:
         """Get all pillars."""
-        async with self._lock:
-            if self._data is None:
-                return []
-            return list(self._data.lookups.pillars.values())
+        snapshot = self._snapshot
+        if snapshot is None:
+            return []
+        return list(snapshot.all_pillars)
 
     async def get_all_team_groups(self) -> list[TeamGroup]:
         """Get all team groups."""
-        async with self._lock:
-            if self._data is None:
-                return []
-            return list(self._data.lookups.team_groups.values())
+        snapshot = self._snapshot
+        if snapshot is None:
+            return []
+        return list(snapshot.all_team_groups)
 
     async def get_all_components(self) -> list[Component]:
         """Get all components."""
-        async with self._lock:
-            if self._data is None:
-                return []
-            return list(self._data.lookups.components.values())
+        snapshot = self._snapshot
+        if snapshot is None:
+            return []
+        return list(snapshot.all_components)
 
     async def get_all_component_names(self) -> list[str]:
         """Get all component names."""
-        async with self._lock:
-            if self._data is None:
-                return []
-            return list(self._data.lookups.components.keys())
+        snapshot = self._snapshot
+        if snapshot is None:
+            return []
+        return list(snapshot.components.keys())
 
     async def get_teams_for_component(
         self, component_name: str
@@ -739,13 +744,11 @@ class AsyncService:
         Returns:
             List of owner entities with ownership types.
         """
-        async with self._lock:
-            if self._data is None:
-                return []
-            owners = self._data.indexes.component_ownership.component_owners.get(
-                component_name, ()
-            )
-            return list(owners)
+        snapshot = self._snapshot
+        if snapshot is None:
+            return []
+        owners = snapshot.component_owners.get(component_name, ())
+        return list(owners)
 
     async def get_components_for_team(self, team_name: str) -> list[ComponentOwnership]:
         """Get all components owned by a team.
@@ -759,103 +762,104 @@ class AsyncService:
         Returns:
             List of ComponentOwnership with component name and ownership types.
         """
-        async with self._lock:
-            if self._data is None:
-                return []
-            team = self._data.lookups.teams.get(team_name)
-            if not team:
-                return []
-            result: list[ComponentOwnership] = []
-            for cr in team.group.component_roles:
-                ownership_types: tuple[str, ...] = ()
-                owners = self._data.indexes.component_ownership.component_owners.get(
-                    cr, ()
-                )
-                for owner in owners:
-                    if owner.name == team_name:
-                        ownership_types = owner.ownership_types
-                        break
-                result.append(
-                    ComponentOwnership(
-                        component=cr,
-                        ownership_types=ownership_types,
-                    )
+        snapshot = self._snapshot
+        if snapshot is None:
+            return []
+        team = snapshot.teams.get(team_name)
+        if not team:
+            return []
+        result: list[ComponentOwnership] = []
+        for cr in team.group.component_roles:
+            ownership_types: tuple[str, ...] = ()
+            owners = snapshot.component_owners.get(cr, ())
+            for owner in owners:
+                if owner.name == team_name:
+                    ownership_types = owner.ownership_types
+                    break
+            result.append(
+                ComponentOwnership(
+                    component=cr,
+                    ownership_types=ownership_types,
                 )
-            return result
+            )
+        return result
 
     async def get_all_team_names(self) -> list[str]:
         """Get all team names."""
-        async with self._lock:
-            if self._data is None:
-                return []
-            return list(self._data.lookups.teams.keys())
+        snapshot = self._snapshot
+        if snapshot is None:
+            return []
+        return list(snapshot.teams.keys())
 
     async def get_all_org_names(self) -> list[str]:
         """Get all organization names."""
-        async with self._lock:
-            if self._data is None:
-                return []
-            return list(self._data.lookups.orgs.keys())
+        snapshot = self._snapshot
+        if snapshot is None:
+            return []
+        return list(snapshot.orgs.keys())
 
     async def get_all_pillar_names(self) -> list[str]:
         """Get all pillar names."""
-        async with self._lock:
-            if self._data is None:
-                return []
-            return list(self._data.lookups.pillars.keys())
+        snapshot = self._snapshot
+        if snapshot is None:
+            return []
+        return list(snapshot.pillars.keys())
 
     async def get_all_team_group_names(self) -> list[str]:
         """Get all team group names."""
-        async with self._lock:
-            if self._data is None:
-                return []
-            return list(self._data.lookups.team_groups.keys())
+        snapshot = self._snapshot
+        if snapshot is None:
+            return []
+        return list(snapshot.team_groups.keys())
 
     async def get_all_employee_uids(self) -> list[str]:
         """Get all employee UIDs in the system."""
-        async with self._lock:
-            if self._data is None:
-                return []
-            return list(self._data.lookups.employees.keys())
+        snapshot = self._snapshot
+        if snapshot is None:
+            return []
+        return list(snapshot.employees.keys())
 
     async def get_team_members(self, team_name: str) -> list[Employee]:
         """Get all members of a team."""
-        async with self._lock:
-            if self._data is None:
-                return []
-            team = self._data.lookups.teams.get(team_name)
-            if not team:
-                return []
-            return [
-                emp
-                for uid in team.group.resolved_people_uid_list
-                if (emp := self._data.lookups.employees.get(uid))
-            ]
+        snapshot = self._snapshot
+        if snapshot is None:
+            return []
+        team = snapshot.teams.get(team_name)
+        if not team:
+            return []
+        return [
+            emp
+            for uid in team.group.resolved_people_uid_list
+            if (emp := snapshot.employees.get(uid))
+        ]
 
     async def get_org_members(self, org_name: str) -> list[Employee]:
         """Get all members of an organization."""
-        async with self._lock:
-            if self._data is None:
-                return []
-            org = self._data.lookups.orgs.get(org_name)
-            if not org:
-                return []
-            return [
-                emp
-                for uid in org.group.resolved_people_uid_list
-                if (emp := self._data.lookups.employees.get(uid))
-            ]
+        snapshot = self._snapshot
+        if snapshot is None:
+            return []
+        org = snapshot.orgs.get(org_name)
+        if not org:
+            return []
+        return [
+            emp
+            for uid in org.group.resolved_people_uid_list
+            if (emp := snapshot.employees.get(uid))
+        ]
 
     def get_version(self) -> DataVersion:
         """Get the current data version (sync - no lock needed for read)."""
-        return self._version
+        snapshot = self._snapshot
+        if snapshot is None:
+            return _NO_VERSION
+        return snapshot.version
 
     async def get_jira_projects(self) -> list[str]:
         """Get all Jira project keys."""
-        async with self._lock:
-            if self._data is None:
-                return []
-            return list(self._data.indexes.jira.project_component_owners.keys())
+        snapshot = self._snapshot
+        if snapshot is None:
+            return []
+        return list(snapshot.jira_project_component_owners.keys())
 
     async def get_jira_components(self, project: str) -> list[str]:
         """Get all components for a Jira project.
@@ -866,13 +870,11 @@ class AsyncService:
         Returns:
             List of component names. "_project_level" indicates project-level ownership.
         """
-        async with self._lock:
-            if self._data is None:
-                return []
-            components = self._data.indexes.jira.project_component_owners.get(
-                project, {}
-            )
-            return list(components.keys())
+        snapshot = self._snapshot
+        if snapshot is None:
+            return []
+        components = snapshot.jira_project_component_owners.get(project, {})
+        return list(components.keys())
 
     async def get_teams_by_jira_project(self, project: str) -> list[JiraOwnerInfo]:
         """Get all teams/entities that own any component in a Jira project.
@@ -883,20 +885,18 @@ class AsyncService:
         Returns:
             Deduplicated list of owner entities across all components.
         """
-        async with self._lock:
-            if self._data is None:
-                return []
-            components = self._data.indexes.jira.project_component_owners.get(
-                project, {}
-            )
-            seen: set[str] = set()
-            result: list[JiraOwnerInfo] = []
-            for owners in components.values():
-                for owner in owners:
-                    if owner.name not in seen:
-                        seen.add(owner.name)
-                        result.append(owner)
-            return result
+        snapshot = self._snapshot
+        if snapshot is None:
+            return []
+        components = snapshot.jira_project_component_owners.get(project, {})
+        seen: set[str] = set()
+        result: list[JiraOwnerInfo] = []
+        for owners in components.values():
+            for owner in owners:
+                if owner.name not in seen:
+                    seen.add(owner.name)
+                    result.append(owner)
+        return result
 
     async def get_teams_by_jira_component(
         self, project: str, component: str
@@ -910,14 +910,12 @@ class AsyncService:
         Returns:
             List of owner entities for the component.
         """
-        async with self._lock:
-            if self._data is None:
-                return []
-            components = self._data.indexes.jira.project_component_owners.get(
-                project, {}
-            )
-            owners = components.get(component, ())
-            return list(owners)
+        snapshot = self._snapshot
+        if snapshot is None:
+            return []
+        components = snapshot.jira_project_component_owners.get(project, {})
+        owners = components.get(component, ())
+        return list(owners)
 
     async def get_jira_ownership_for_team(self, team_name: str) -> list[dict[str, str]]:
         """Get all Jira projects and components owned by a team.
@@ -928,86 +926,84 @@ class AsyncService:
         Returns:
             List of dicts with "project" and "component" keys.
         """
-        async with self._lock:
-            if self._data is None:
-                return []
-            result: list[dict[str, str]] = []
-            for (
-                project,
-                components,
-            ) in self._data.indexes.jira.project_component_owners.items():
-                for component, owners in components.items():
-                    for owner in owners:
-                        if owner.name == team_name:
-                            result.append({"project": project, "component": component})
-                            break
-            return result
+        snapshot = self._snapshot
+        if snapshot is None:
+            return []
+        result: list[dict[str, str]] = []
+        for (
+            project,
+            components,
+        ) in snapshot.jira_project_component_owners.items():
+            for component, owners in components.items():
+                for owner in owners:
+                    if owner.name == team_name:
+                        result.append({"project": project, "component": component})
+                        break
+        return result
 
     async def get_context_for_team(
         self, team_name: str
     ) -> list[ContextItemInfo]:
         """Get resolved context items for a team (including inherited)."""
-        async with self._lock:
-            if self._data is None or not self._data.lookups.teams:
-                return []
-            team = self._data.lookups.teams.get(team_name)
-            if team is None:
-                return []
-            return list(team.group.resolved_context)
+        snapshot = self._snapshot
+        if snapshot is None or not snapshot.teams:
+            return []
+        team = snapshot.teams.get(team_name)
+        if team is None:
+            return []
+        return list(team.group.resolved_context)
 
     async def get_context_for_entity(
         self, entity_name: str, entity_type: str = "team"
     ) -> list[ContextItemInfo]:
         """Get resolved context items for any entity type."""
-        async with self._lock:
-            if self._data is None:
-                return []
-            entity = self._get_entity_by_type(entity_name, entity_type)
-            if entity is None:
-                return []
-            return list(entity.group.resolved_context)
+        snapshot = self._snapshot
+        if snapshot is None:
+            return []
+        entity = self._get_entity_by_type(snapshot.data, entity_name, entity_type)
+        if entity is None:
+            return []
+        return list(entity.group.resolved_context)
 
     async def get_context_by_type(
         self, entity_name: str, context_type: str, entity_type: str = "team"
     ) -> list[ContextItemInfo]:
         """Get resolved context items filtered by a specific context type."""
-        async with self._lock:
-            if self._data is None:
-                return []
-            entity = self._get_entity_by_type(entity_name, entity_type)
-            if entity is None:
-                return []
-            return [
-                item
-                for item in entity.group.resolved_context
-                if context_type in item.types
-            ]
+        snapshot = self._snapshot
+        if snapshot is None:
+            return []
+        entity = self._get_entity_by_type(snapshot.data, entity_name, entity_type)
+        if entity is None:
+            return []
+        return [
+            item for item in entity.group.resolved_context if context_type in item.types
+        ]
 
     async def get_all_context_types_for_entity(
         self, entity_name: str, entity_type: str = "team"
     ) -> list[str]:
         """Get distinct context types available for an entity."""
-        async with self._lock:
-            if self._data is None:
-                return []
-            entity = self._get_entity_by_type(entity_name, entity_type)
-            if entity is None:
-                return []
-            seen: set[str] = set()
-            result: list[str] = []
-            for item in entity.group.resolved_context:
-                for t in item.types:
-                    if t not in seen:
-                        seen.add(t)
-                        result.append(t)
-            return result
+        snapshot = self._snapshot
+        if snapshot is None:
+            return []
+        entity = self._get_entity_by_type(snapshot.data, entity_name, entity_type)
+        if entity is None:
+            return []
+        seen: set[str] = set()
+        result: list[str] = []
+        for item in entity.group.resolved_context:
+            for t in item.types:
+                if t not in seen:
+                    seen.add(t)
+                    result.append(t)
+        return result
 
     async def get_context_type_descriptions(self) -> dict[str, str]:
         """Get the description registry for all context types."""
-        async with self._lock:
-            if self._data is None:
-                return {}
-            return dict(self._data.metadata.context_type_descriptions)
+        snapshot = self._snapshot
+        if snapshot is None:
+            return {}
+        return dict(snapshot.data.metadata.context_type_descriptions)
 
 
 async def _async_retry_with_backoff(
@@ -0,0 +1,297 @@
+"""Internal hierarchy index: structures derived once per loaded dataset.
+
+Not part of the public API. Service and AsyncService build one index per
+Data object and answer hierarchy queries from it instead of walking parent
+references on every call.
+"""
+
+import sys
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+
+from ._types import (
+    Data,
+    HierarchyNode,
+    HierarchyPathEntry,
+    MembershipInfo,
+    MembershipType,
+    Org,
+    OrgInfo,
+    OrgInfoType,
+    Pillar,
+    Team,
+    TeamGroup,
+)
+
+_Entity = Team | Org | Pillar | TeamGroup
+# Tree-building frame: (name, type, children still to visit, finished children)
+_Frame = tuple[str, str, Iterator[tuple[str, str]], list[HierarchyNode]]
+
+# Lowercase entity types that can appear in the hierarchy
+_ENTITY_TYPES = frozenset({"team", "org", "pillar", "team_group"})
+
+_ORG_INFO_TYPES = {
+    "org": OrgInfoType.ORGANIZATION,
+    "pillar": OrgInfoType.PILLAR,
+    "team_group": OrgInfoType.TEAM_GROUP,
+    "team": OrgInfoType.PARENT_TEAM,
+}
+
+
+@dataclass(slots=True)
+class HierarchyIndex:
+    """Hierarchy structures derived from one Data object.
+
+    Not frozen: ``descendants`` and ``user_orgs`` fill in lazily. Both stay
+    bounded by the dataset, at most one entry per entity and per user with
+    memberships respectively.
+    """
+
+    # (entity name, lowercase entity type) -> path from the entity to its root
+    paths: Mapping[tuple[str, str], tuple[HierarchyPathEntry, ...]]
+    # team name -> names of the orgs on its path
+    team_orgs: Mapping[str, frozenset[str]]
+    # team name -> the team and its ancestors as OrgInfo, deduplicated by name
+    team_org_infos: Mapping[str, tuple[OrgInfo, ...]]
+    # entity name -> its type; teams win over orgs, pillars and team groups
+    entity_types: Mapping[str, str]
+    # parent name -> (child name, child type) pairs, in lookup order
+    children: Mapping[str, tuple[tuple[str, str], ...]]
+    # root entity name -> descendants tree, filled on first request. Every
+    # caller gets the same tree, which is safe only because HierarchyNode is
+    # a frozen model with no per-instance cached state: keep it that way.
+    descendants: dict[str, HierarchyNode] = field(default_factory=dict)
+    # uid -> orgs the user belongs to directly or through a team, filled on
+    # first request from that uid's memberships; uids without memberships
+    # are never stored
+    user_orgs: dict[str, frozenset[str]] = field(default_factory=dict)
+
+
+def _entity_tables(data: Data) -> dict[str, Mapping[str, _Entity]]:
+    """Map each lowercase entity type to its lookup table."""
+    return {
+        "team": data.lookups.teams,
+        "org": data.lookups.orgs,
+        "pillar": data.lookups.pillars,
+        "team_group": data.lookups.team_groups,
+    }
+
+
+def _pooled_entry(
+    pool: dict[tuple[str, str], HierarchyPathEntry], name: str, type_: str
+) -> HierarchyPathEntry:
+    """Return the shared path entry for (name, type), creating it once."""
+    entry = pool.get((name, type_))
+    if entry is None:
+        entry = pool[(name, type_)] = HierarchyPathEntry(name=name, type=type_)
+    return entry
+
+
+def _walk_path(
+    tables: Mapping[str, Mapping[str, _Entity]],
+    pool: dict[tuple[str, str], HierarchyPathEntry],
+    entity_name: str,
+    entity_type: str,
+    entity: _Entity,
+) -> tuple[HierarchyPathEntry, ...]:
+    """Walk parent references from an entity to the root, stopping at cycles."""
+    path = [_pooled_entry(pool, entity_name, entity_type)]
+    visited = {entity_name}
+    current: _Entity | None = entity
+    # Runs for every entity at load time, so bind the hot lookups once
+    intern = sys.intern
+    get_table = tables.get
+    append = path.append
+
+    while current and current.parent:
+        parent = current.parent
+        # Share one string object with the interned lookup keys
+        parent_name = intern(parent.name)
+        if parent_name in visited:
+            break
+        visited.add(parent_name)
+        append(_pooled_entry(pool, parent_name, parent.type))
+        table = get_table(parent.type.lower())
+        current = table.get(parent_name) if table is not None else None
+
+    return tuple(path)
+
+
+def _team_org_infos(
+    pool: dict[tuple[str, str], OrgInfo],
+    team_name: str,
+    path: tuple[HierarchyPathEntry, ...],
+) -> tuple[OrgInfo, ...]:
+    """Describe a team and the ancestors on its path as OrgInfo entries."""
+    infos = [OrgInfo(name=team_name, type=OrgInfoType.TEAM)]
+    seen = {team_name}
+    for entry in path[1:]:
+        if entry.name not in seen:
+            org_type = _ORG_INFO_TYPES.get(entry.type.lower(), OrgInfoType.ORGANIZATION)
+            info = pool.get((entry.name, org_type))
+            if info is None:
+                info = pool[(entry.name, org_type)] = OrgInfo(
+                    name=entry.name, type=org_type
+                )
+            infos.append(info)
+            seen.add(entry.name)
+    return tuple(infos)
+
+
+def build_hierarchy_index(data: Data) -> HierarchyIndex:
+    """Build the hierarchy index for a dataset."""
+    tables = _entity_tables(data)
+    # Identical entries (e.g. a root org on every path) are shared instances
+    entry_pool: dict[tuple[str, str], HierarchyPathEntry] = {}
+    org_info_pool: dict[tuple[str, str], OrgInfo] = {}
+    paths: dict[tuple[str, str], tuple[HierarchyPathEntry, ...]] = {}
+    entity_types: dict[str, str] = {}
+    children: dict[str, list[tuple[str, str]]] = {}
+    for entity_type, table in tables.items():
+        for name, entity in table.items():
+            paths[(name, entity_type)] = _walk_path(
+                tables, entry_pool, name, entity_type, entity
+            )
+            entity_types.setdefault(name, entity_type)
+            if entity.parent:
+                parent_name = sys.intern(entity.parent.name)
+                children.setdefault(parent_name, []).append((name, entity_type))
+    team_orgs = {
+        name: frozenset(e.name for e in paths[(name, "team")] if e.type == "org")
+        for name in data.lookups.teams
+    }
+    team_org_infos = {
+        name: _team_org_infos(org_info_pool, name, paths[(name, "team")])
+        for name in data.lookups.teams
+    }
+    return HierarchyIndex(
+        paths=paths,
+        team_orgs=team_orgs,
+        team_org_infos=team_org_infos,
+        entity_types=entity_types,
+        children={parent: tuple(kids) for parent, kids in children.items()},
+    )
+
+
+def _build_tree(
+    children: Mapping[str, tuple[tuple[str, str], ...]], root_name: str, root_type: str
+) -> HierarchyNode:
+    """Build a descendants tree with an explicit stack instead of recursion.
+
+    Nodes are visited in the same depth-first order as a recursive build. A
+    node reached a second time (only possible in malformed data) is emitted
+    as a leaf, which also stops cycles.
+    """
+    visited = {root_name}
+    stack: list[_Frame] = [
+        (root_name, root_type, iter(children.get(root_name, ())), [])
+    ]
+
+    while True:
+        name, type_, pending, built = stack[-1]
+        for child_name, child_type in pending:
+            if child_name in visited:
+                built.append(
+                    HierarchyNode(name=child_name, type=child_type, children=())
+                )
+                continue
+            visited.add(child_name)
+            stack.append(
+                (child_name, child_type, iter(children.get(child_name, ())), [])
+            )
+            break
+        else:
+            node = HierarchyNode(name=name, type=type_, children=tuple(built))
+            stack.pop()
+            if not stack:
+                return node
+            stack[-1][3].append(node)
+
+
+def get_descendants_tree(
+    index: HierarchyIndex, entity_name: str
+) -> HierarchyNode | None:
+    """Return the descendants tree rooted at an entity, or None if not found."""
+    tree = index.descendants.get(entity_name)
+    if tree is not None:
+        return tree
+
+    entity_type = index.entity_types.get(entity_name)
+    if entity_type is None:
+        return None
+
+    tree = _build_tree(index.children, entity_name, entity_type)
+    index.descendants[entity_name] = tree
+    return tree
+
+
+def get_user_organizations(
+    index: HierarchyIndex, memberships: Iterable[MembershipInfo]
+) -> list[OrgInfo]:
+    """Collect the orgs, teams and ancestors for a user's memberships.
+
+    Entries keep membership order and each name appears once.
+    """
+    orgs: list[OrgInfo] = []
+    seen: set[str] = set()
+
+    for membership in memberships:
+        if membership.type == MembershipType.ORG:
+            if membership.name not in seen:
+                orgs.append(
+                    OrgInfo(name=membership.name, type=OrgInfoType.ORGANIZATION)
+                )
+                seen.add(membership.name)
+        elif membership.type == MembershipType.TEAM:
+            infos = index.team_org_infos.get(membership.name)
+            if infos is None:
+                # Team missing from lookups: it has no path to add
+                infos = (OrgInfo(name=membership.name, type=OrgInfoType.TEAM),)
+            for info in infos:
+                if info.name not in seen:
+                    orgs.append(info)
+                    seen.add(info.name)
+
+    return orgs
+
+
+def get_user_org_names(
+    index: HierarchyIndex, uid: str, memberships: Sequence[MembershipInfo]
+) -> frozenset[str]:
+    """Return the org names a user belongs to directly or through a team.
+
+    The memberships must come from the dataset the index was built from; the
+    result is cached per uid that has memberships.
+    """
+    if not memberships:
+        return frozenset()
+    orgs = index.user_orgs.get(uid)
+    if orgs is not None:
+        return orgs
+
+    names: set[str] = set()
+    for membership in memberships:
+        if membership.type == MembershipType.ORG:
+            names.add(membership.name)
+        elif membership.type == MembershipType.TEAM:
+            names.update(index.team_orgs.get(membership.name, ()))
+
+    orgs = index.user_orgs[uid] = frozenset(names)
+    return orgs
+
+
+def get_hierarchy_path(
+    index: HierarchyIndex, entity_name: str, entity_type: str
+) -> list[HierarchyPathEntry]:
+    """Return an entity's path to the root as a new list, or [] if not found."""
+    key_type = entity_type.lower()
+    if key_type not in _ENTITY_TYPES:
+        return []
+    path = index.paths.get((entity_name, key_type))
+    if path is None:
+        return []
+    result = list(path)
+    if result[0].type != entity_type:
+        # The first entry echoes the type as the caller spelled it
+        result[0] = HierarchyPathEntry(name=entity_name, type=entity_type)
+    return result
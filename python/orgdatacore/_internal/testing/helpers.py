@@ -1,5 +1,6 @@
 """Test helpers for orgdatacore."""
 
+import functools
 import json
 from collections.abc import Callable
 from io import BytesIO
@@ -53,12 +54,21 @@ class FakeDataSource:
         self.watch_error = watch_error
         self.description = description
         self.watch_called = False
+        self._encoded_from: str | None = None
+        self._encoded = b""
 
     def load(self) -> BinaryIO:
-        """Return the test data."""
+        """Return the test data.
+
+        The UTF-8 encoding is cached until ``data`` is replaced. BytesIO
+        shares an unmodified bytes buffer, so no copy is made per load.
+        """
         if self.load_error:
             raise self.load_error
-        return BytesIO(self.data.encode("utf-8"))
+        if self._encoded_from is not self.data:
+            self._encoded = self.data.encode("utf-8")
+            self._encoded_from = self.data
+        return BytesIO(self._encoded)
 
     def watch(self, callback: Callable[[], Exception | None]) -> Exception | None:
         """Track that watch was called but don't actually watch."""
@@ -200,7 +210,12 @@ def create_test_data() -> Data:
     )
 
 
+@functools.lru_cache(maxsize=1)
 def create_test_data_json() -> str:
-    """Create test data as JSON string."""
+    """Create test data as JSON string.
+
+    The result is cached; the returned string is immutable so callers can
+    share it safely.
+    """
     data = create_test_data()
     return json.dumps(data_to_dict(data))
@@ -1,11 +1,22 @@
 """Service implementation for orgdatacore."""
 
 import json
+import sys
 import threading
 from datetime import datetime, timedelta
-from typing import Any, cast
+from typing import Any, TypeVar, cast
+
+from pydantic import TypeAdapter
 
 from ._exceptions import DataLoadError
+from ._hierarchy import (
+    HierarchyIndex,
+    build_hierarchy_index,
+    get_descendants_tree,
+    get_hierarchy_path,
+    get_user_org_names,
+    get_user_organizations,
+)
 from ._log import get_logger
 from ._types import (
     Component,
@@ -31,18 +42,39 @@ from ._types import (
     Metadata,
     Org,
     OrgInfo,
-    OrgInfoType,
     Pillar,
     SlackIDMappings,
     Team,
     TeamGroup,
 )
 
+_T = TypeVar("_T")
+
+# Validators are compiled once at import and reused for every load, so each
+# lookup table is validated in a single pydantic-core call.
+_EMPLOYEES_ADAPTER = TypeAdapter(dict[str, Employee])
+_TEAMS_ADAPTER = TypeAdapter(dict[str, Team])
+_ORGS_ADAPTER = TypeAdapter(dict[str, Org])
+_PILLARS_ADAPTER = TypeAdapter(dict[str, Pillar])
+_TEAM_GROUPS_ADAPTER = TypeAdapter(dict[str, TeamGroup])
+_COMPONENTS_ADAPTER = TypeAdapter(dict[str, Component])
+_MEMBERSHIP_INDEX_ADAPTER = TypeAdapter(dict[str, tuple[MembershipInfo, ...]])
+
+
+def _validate_table(adapter: TypeAdapter[dict[str, _T]], raw: Any) -> dict[str, _T]:
+    """Validate a name-keyed table and intern its keys."""
+    return {sys.intern(k): v for k, v in adapter.validate_python(raw).items()}
+
 
 def _normalize_slack_channel(channel: str) -> str:
     return channel.strip().lstrip("#").lower()
 
 
+def _intern_mapping(raw: dict[str, str]) -> dict[str, str]:
+    """Intern both sides of a string-to-string ID mapping."""
+    return {sys.intern(k): sys.intern(v) for k, v in raw.items()}
+
+
 def _parse_jira_index(jira_raw: dict[str, Any]) -> JiraIndex:
     """Parse the Jira index from raw data."""
     project_component_owners: dict[str, dict[str, tuple[JiraOwnerInfo, ...]]] = {}
@@ -77,41 +109,32 @@ def _parse_component_ownership_index(raw: dict[str, Any]) -> ComponentOwnershipI
 
 
 def parse_data(raw_data: dict[str, Any]) -> Data:
-    """Parse the complete Data structure from JSON."""
+    """Parse the complete Data structure from JSON.
+
+    Lookup keys and ID mapping values are interned so that chained lookups
+    (e.g. Slack ID -> UID -> employee) compare keys by identity.
+    """
     metadata = Metadata.model_validate(raw_data.get("metadata", {}))
 
     lookups_raw = raw_data.get("lookups", {})
     lookups = Lookups(
-        employees={
-            k: Employee.model_validate(v)
-            for k, v in lookups_raw.get("employees", {}).items()
-        },
-        teams={
-            k: Team.model_validate(v) for k, v in lookups_raw.get("teams", {}).items()
-        },
-        orgs={k: Org.model_validate(v) for k, v in lookups_raw.get("orgs", {}).items()},
-        pillars={
-            k: Pillar.model_validate(v)
-            for k, v in lookups_raw.get("pillars", {}).items()
-        },
-        team_groups={
-            k: TeamGroup.model_validate(v)
-            for k, v in lookups_raw.get("team_groups", {}).items()
-        },
-        components={
-            k: Component.model_validate(v)
-            for k, v in lookups_raw.get("components", {}).items()
-        },
+        employees=_validate_table(_EMPLOYEES_ADAPTER, lookups_raw.get("employees", {})),
+        teams=_validate_table(_TEAMS_ADAPTER, lookups_raw.get("teams", {})),
+        orgs=_validate_table(_ORGS_ADAPTER, lookups_raw.get("orgs", {})),
+        pillars=_validate_table(_PILLARS_ADAPTER, lookups_raw.get("pillars", {})),
+        team_groups=_validate_table(
+            _TEAM_GROUPS_ADAPTER, lookups_raw.get("team_groups", {})
+        ),
+        components=_validate_table(
+            _COMPONENTS_ADAPTER, lookups_raw.get("components", {})
+        ),
     )
 
     indexes_raw = raw_data.get("indexes", {})
     membership_raw = indexes_raw.get("membership", {})
 
     membership_index_raw = membership_raw.get("membership_index", {})
-    membership_index = {
-        k: tuple(MembershipInfo.model_validate(m) for m in v)
-        for k, v in membership_index_raw.items()
-    }
+    membership_index = _validate_table(_MEMBERSHIP_INDEX_ADAPTER, membership_index_raw)
 
     membership = MembershipIndex(
         membership_index=membership_index,
@@ -119,12 +142,16 @@ def parse_data(raw_data: dict[str, Any]) -> Data:
 
     slack_mappings_raw = indexes_raw.get("slack_id_mappings", {})
     slack_id_mappings = SlackIDMappings(
-        slack_uid_to_uid=slack_mappings_raw.get("slack_uid_to_uid", {}),
+        slack_uid_to_uid=_intern_mapping(
+            slack_mappings_raw.get("slack_uid_to_uid", {})
+        ),
     )
 
     github_mappings_raw = indexes_raw.get("github_id_mappings", {})
     github_id_mappings = GitHubIDMappings(
-        github_id_to_uid=github_mappings_raw.get("github_id_to_uid", {}),
+        github_id_to_uid=_intern_mapping(
+            github_mappings_raw.get("github_id_to_uid", {})
+        ),
     )
 
     jira_raw = indexes_raw.get("jira", {})
@@ -200,6 +227,9 @@ class Service:
         self._watcher_running = False
         self._stop_event = threading.Event()
         self._slack_channel_index: dict[str, list[str]] = {}
+        # Derived from _data; rebuilt whenever _data is replaced
+        self._hierarchy: HierarchyIndex | None = None
+        self._hierarchy_data: Data | None = None
 
         if data_source is not None:
             self.load_from_data_source(data_source)
@@ -249,9 +279,12 @@ class Service:
             ) from e
 
         _validate_data(org_data, source)
+        hierarchy = build_hierarchy_index(org_data)
 
         with self._lock:
             self._data = org_data
+            self._hierarchy = hierarchy
+            self._hierarchy_data = org_data
             self._version = DataVersion(
                 load_time=datetime.now(),
                 org_count=len(org_data.lookups.orgs),
@@ -654,17 +687,10 @@ class Service:
             return False
 
         memberships = self._data.indexes.membership.membership_index.get(uid, ())
-
-        for membership in memberships:
-            if membership.type == MembershipType.ORG and membership.name == org_name:
-                return True
-            elif membership.type == MembershipType.TEAM:
-                hierarchy_path = self._get_hierarchy_path(membership.name, "team")
-                for entry in hierarchy_path:
-                    if entry.type == "org" and entry.name == org_name:
-                        return True
-
-        return False
+        if not memberships:
+            return False
+        index = self._get_hierarchy_index(self._data)
+        return org_name in get_user_org_names(index, uid, memberships)
 
     def is_slack_user_in_org(self, slack_id: str, org_name: str) -> bool:
         """Check if a Slack user is in a specific organization."""
@@ -685,49 +711,10 @@ class Service:
                 return []
 
             memberships = self._data.indexes.membership.membership_index.get(uid, ())
-            orgs: list[OrgInfo] = []
-            seen: set[str] = set()
-
-            for membership in memberships:
-                if membership.type == MembershipType.ORG:
-                    if membership.name not in seen:
-                        orgs.append(
-                            OrgInfo(name=membership.name, type=OrgInfoType.ORGANIZATION)
-                        )
-                        seen.add(membership.name)
-
-                elif membership.type == MembershipType.TEAM:
-                    if membership.name not in seen:
-                        orgs.append(
-                            OrgInfo(name=membership.name, type=OrgInfoType.TEAM)
-                        )
-                        seen.add(membership.name)
-
-                    hierarchy_path = self._get_hierarchy_path(membership.name, "team")
-                    self._add_hierarchy_path_items(orgs, seen, tuple(hierarchy_path))
-
-            return orgs
-
-    def _add_hierarchy_path_items(
-        self,
-        orgs: list[OrgInfo],
-        seen: set[str],
-        hierarchy_path: tuple[HierarchyPathEntry, ...],
-    ) -> None:
-        """Add hierarchy path items to the orgs list, avoiding duplicates."""
-        type_to_org_info_type = {
-            "org": OrgInfoType.ORGANIZATION,
-            "pillar": OrgInfoType.PILLAR,
-            "team_group": OrgInfoType.TEAM_GROUP,
-            "team": OrgInfoType.PARENT_TEAM,
-        }
-        for entry in hierarchy_path[1:]:
-            if entry.name not in seen:
-                org_type = type_to_org_info_type.get(
-                    entry.type.lower(), OrgInfoType.ORGANIZATION
-                )
-                orgs.append(OrgInfo(name=entry.name, type=org_type))
-                seen.add(entry.name)
+            if not memberships:
+                return []
+            index = self._get_hierarchy_index(self._data)
+            return get_user_organizations(index, memberships)
 
     def _get_uid_from_slack_id(self, slack_id: str) -> str:
         """Get the UID for a given Slack ID."""
@@ -872,26 +859,12 @@ class Service:
             return self._data.lookups.team_groups.get(entity_name)
         return None
 
-    def _get_entity_type(self, entity_name: str) -> str:
-        """Look up entity type by scanning lookups."""
-        if self._data is None:
-            return ""
-        if entity_name in self._data.lookups.teams:
-            return "team"
-        if entity_name in self._data.lookups.orgs:
-            return "org"
-        if entity_name in self._data.lookups.pillars:
-            return "pillar"
-        if entity_name in self._data.lookups.team_groups:
-            return "team_group"
-        return ""
-
     def get_hierarchy_path(
         self, entity_name: str, entity_type: str = "team"
     ) -> list[HierarchyPathEntry]:
         """Get ordered hierarchy path from entity to root.
 
-        Computes path by walking parent references in entities.
+        Paths are precomputed once per loaded dataset.
 
         Args:
             entity_name: Name of the team/org/pillar/team_group
@@ -903,35 +876,29 @@ class Service:
         with self._lock:
             return self._get_hierarchy_path(entity_name, entity_type)
 
+    def _get_hierarchy_index(self, data: Data) -> HierarchyIndex:
+        """Internal: Get the hierarchy index for data. Caller must hold lock.
+
+        Built at load time; rebuilt here if _data was replaced directly.
+        """
+        if self._hierarchy is None or self._hierarchy_data is not data:
+            self._hierarchy = build_hierarchy_index(data)
+            self._hierarchy_data = data
+        return self._hierarchy
+
     def _get_hierarchy_path(
         self, entity_name: str, entity_type: str = "team"
     ) -> list[HierarchyPathEntry]:
         """Internal: Get hierarchy path. Caller must hold lock."""
         if self._data is None:
             return []
-
-        entity = self._get_entity_by_type(entity_name, entity_type)
-        if entity is None:
-            return []
-
-        path = [HierarchyPathEntry(name=entity_name, type=entity_type)]
-        visited = {entity_name}
-        current: Team | Org | Pillar | TeamGroup | None = entity
-
-        while current and current.parent:
-            parent = current.parent
-            if parent.name in visited:
-                break
-            visited.add(parent.name)
-            path.append(HierarchyPathEntry(name=parent.name, type=parent.type))
-            current = self._get_entity_by_type(parent.name, parent.type)
-
-        return path
+        index = self._get_hierarchy_index(self._data)
+        return get_hierarchy_path(index, entity_name, entity_type)
 
     def get_descendants_tree(self, entity_name: str) -> HierarchyNode | None:
         """Get all descendants of an entity as a nested tree.
 
-        Computes tree by scanning all entities for children.
+        Trees are built once per root entity and loaded dataset.
 
         Args:
             entity_name: Name of the org/pillar/team_group/team
@@ -942,47 +909,8 @@ class Service:
         with self._lock:
             if self._data is None:
                 return None
-
-            # Build children map by scanning all entities
-            children_map: dict[str, list[tuple[str, str]]] = {}
-            all_entities: list[tuple[str, Team | Org | Pillar | TeamGroup, str]] = [
-                *(
-                    (name, info, "team")
-                    for name, info in self._data.lookups.teams.items()
-                ),
-                *(
-                    (name, info, "org")
-                    for name, info in self._data.lookups.orgs.items()
-                ),
-                *(
-                    (name, info, "pillar")
-                    for name, info in self._data.lookups.pillars.items()
-                ),
-                *(
-                    (name, info, "team_group")
-                    for name, info in self._data.lookups.team_groups.items()
-                ),
-            ]
-
-            entity_type = self._get_entity_type(entity_name)
-            if not entity_type:
-                return None
-
-            for name, info, etype in all_entities:
-                if info.parent:
-                    if info.parent.name not in children_map:
-                        children_map[info.parent.name] = []
-                    children_map[info.parent.name].append((name, etype))
-
-            def build_node(name: str, type_: str, visited: set[str]) -> HierarchyNode:
-                if name in visited:
-                    return HierarchyNode(name=name, type=type_, children=())
-                visited.add(name)
-                children = children_map.get(name, [])
-                child_nodes = tuple(build_node(n, t, visited) for n, t in children)
-                return HierarchyNode(name=name, type=type_, children=child_nodes)
-
-            return build_node(entity_name, entity_type, set())
+            index = self._get_hierarchy_index(self._data)
+            return get_descendants_tree(index, entity_name)
 
     def get_jira_projects(self) -> list[str]:
         """Get all Jira project keys."""
@@ -1,8 +1,9 @@
 """Type definitions and constants for orgdatacore."""
 
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from datetime import datetime, timedelta
 from enum import StrEnum
+from types import MappingProxyType
 from typing import Any, BinaryIO, Protocol
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
@@ -423,6 +424,19 @@ class HierarchyNode(BaseModel):
     type: str = ""
     children: tuple["HierarchyNode", ...] = ()
 
+    @property
+    def children_by_name(self) -> Mapping[str, "HierarchyNode"]:
+        """Read-only view of the direct children keyed by name.
+
+        Python-only convenience with no Go counterpart. Built on each access,
+        in child order; hold on to the result for repeated lookups. If names
+        repeat, the first child wins.
+        """
+        by_name: dict[str, HierarchyNode] = {}
+        for child in self.children:
+            by_name.setdefault(child.name, child)
+        return MappingProxyType(by_name)
+
 
 class ComponentOwnerInfo(BaseModel):
     """Represents an entity that owns a component, with ownership type."""
@@ -0,0 +1,33 @@
+"""Factories for small synthetic Data objects used by unit tests."""
+
+import functools
+
+from orgdatacore import (
+    Data,
+    Employee,
+    GitHubIDMappings,
+    Indexes,
+    Lookups,
+    MembershipIndex,
+    SlackIDMappings,
+)
+
+
+@functools.cache
+def make_synthetic_data(**employee_fields: str | int | bool) -> Data:
+    """Build Data holding a single employee with the given fields.
+
+    The employee's ``uid`` defaults to "testuser"; every other field is
+    passed straight to Employee. Indexes are left empty. Results are cached
+    per argument set, which is safe because Data and Employee are frozen.
+    """
+    employee_fields.setdefault("uid", "testuser")
+    employee = Employee.model_validate(employee_fields)
+    return Data(
+        lookups=Lookups(employees={employee.uid: employee}),
+        indexes=Indexes(
+            membership=MembershipIndex(),
+            slack_id_mappings=SlackIDMappings(),
+            github_id_mappings=GitHubIDMappings(),
+        ),
+    )
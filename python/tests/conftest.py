@@ -1,32 +1,104 @@
-"""Pytest configuration and fixtures for orgdatacore tests."""
+"""Pytest configuration and fixtures for orgdatacore tests.
+
+Session-scoped fixtures are per process, so under ``pytest -n auto`` each
+xdist worker builds its own copies and nothing is shared between workers.
+"""
 
 from pathlib import Path
 
 import pytest
 
-from orgdatacore import Service
+from orgdatacore import Data, Service
 
 # Import from internal testing module - NOT part of public API
-from orgdatacore._internal.testing import FileDataSource
+from orgdatacore._internal.testing import FakeDataSource, FileDataSource
 
 
-@pytest.fixture
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Run tests marked ``slow`` after everything else.
+
+    The sort is stable, so the relative order within each group is kept and
+    a failing fast test surfaces (and stops ``-x`` runs) before slow ones.
+    """
+    items.sort(key=lambda item: item.get_closest_marker("slow") is not None)
+
+
+@pytest.fixture(scope="session")
 def test_data_path() -> Path:
     """Get path to the test data file."""
     # Go up from python/tests to the root, then into testdata
     return Path(__file__).parent.parent.parent / "testdata" / "test_org_data.json"
 
 
-@pytest.fixture
-def service(test_data_path: Path) -> Service:
-    """Create a service loaded with test data."""
+@pytest.fixture(scope="session")
+def file_source(test_data_path: Path) -> FileDataSource:
+    """File data source for the shared test data file.
+
+    Shared by the whole session. Loading from it is stateless, but tests must
+    not start a watcher on it (stopping one would affect later tests).
+    """
+    return FileDataSource(str(test_data_path))
+
+
+@pytest.fixture(scope="session")
+def missing_file_source(tmp_path_factory: pytest.TempPathFactory) -> FileDataSource:
+    """File data source pointing at a path guaranteed not to exist."""
+    return FileDataSource(str(tmp_path_factory.mktemp("missing") / "nope.json"))
+
+
+@pytest.fixture(scope="session")
+def loaded_data_bytes(test_data_path: Path) -> bytes:
+    """Raw contents of the shared test data file, read once per session."""
+    return test_data_path.read_bytes()
+
+
+@pytest.fixture(scope="session")
+def memory_source(loaded_data_bytes: bytes) -> FakeDataSource:
+    """In-memory data source serving the shared test data.
+
+    Loads from it skip the filesystem; the encoded payload is cached by the
+    source, so repeated loads only re-parse JSON.
+    """
+    return FakeDataSource(data=loaded_data_bytes.decode("utf-8"))
+
+
+@pytest.fixture(scope="session")
+def service(memory_source: FakeDataSource) -> Service:
+    """Create a service loaded with test data.
+
+    Shared by the whole session, so tests must treat it as read-only. Tests
+    that load, reload or assign data use ``fresh_service`` or build their
+    own Service instead.
+    """
     svc = Service()
-    file_source = FileDataSource(str(test_data_path))
-    svc.load_from_data_source(file_source)
+    svc.load_from_data_source(memory_source)
     return svc
 
 
 @pytest.fixture
+def fresh_service(memory_source: FakeDataSource) -> Service:
+    """Create a service loaded with test data that a single test may mutate."""
+    return Service(data_source=memory_source)
+
+
+@pytest.fixture(scope="module")
+def service_with_data(request: pytest.FixtureRequest) -> Service:
+    """Create a service holding the Data passed in by indirect parametrization.
+
+    Use ``@pytest.mark.parametrize("service_with_data", [data], indirect=True)``.
+    pytest caches one Service per parameter for the module, so tests sharing
+    a Data object share the service and must treat it as read-only.
+    """
+    data: Data = request.param
+    svc = Service()
+    svc._data = data
+    return svc
+
+
+@pytest.fixture(scope="session")
 def empty_service() -> Service:
-    """Create an empty service with no data loaded."""
+    """Create an empty service with no data loaded.
+
+    Shared by the whole session; only failing loads may be attempted on it.
+    """
     return Service()
@@ -10,6 +10,8 @@ import pytest
 from orgdatacore import AsyncService, DataLoadError
 from orgdatacore._internal.testing import create_test_data_json
 
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
 
 class AsyncFakeDataSource:
     """Async fake data source for testing."""
@@ -17,11 +19,12 @@ class AsyncFakeDataSource:
     def __init__(self, data: str = "", load_error: Exception | None = None) -> None:
         self.data = data
         self.load_error = load_error
+        self._data_bytes = data.encode("utf-8")
 
-    async def load(self) -> BinaryIO:
+    async def load(self) -> bytes:
         if self.load_error:
             raise self.load_error
-        return BytesIO(self.data.encode("utf-8"))
+        return self._data_bytes
 
     async def watch(self, callback: Callable[[], Exception | None]) -> Exception | None:
         return None
@@ -30,10 +33,78 @@ class AsyncFakeDataSource:
         return "async-fake-data-source"
 
 
+class PayloadDataSource:
+    """Async data source whose load returns a payload built by a factory."""
+
+    def __init__(
+        self, make_payload: Callable[[], bytes | memoryview | BinaryIO]
+    ) -> None:
+        self.make_payload = make_payload
+
+    async def load(self) -> bytes | memoryview | BinaryIO:
+        return self.make_payload()
+
+    async def watch(self, callback: Callable[[], Exception | None]) -> Exception | None:
+        return None
+
+    def __str__(self) -> str:
+        return "payload-data-source"
+
+
+class BlockingDataSource:
+    """Data source with a blocking watch for testing."""
+
+    def __init__(self, data: str) -> None:
+        self.data = data
+
+    async def load(self) -> BinaryIO:
+        return BytesIO(self.data.encode("utf-8"))
+
+    async def watch(self, callback: Callable[[], Exception | None]) -> Exception | None:
+        # Block on a future nothing resolves; only task cancellation ends it
+        try:
+            await asyncio.get_running_loop().create_future()
+        except asyncio.CancelledError:
+            pass
+        return None
+
+    def __str__(self) -> str:
+        return "blocking-data-source"
+
+
+class StoppableDataSource:
+    """Data source with a stop() method for testing."""
+
+    def __init__(self, data: str) -> None:
+        self.data = data
+        self.stop_called = False
+        self._block_event = asyncio.Event()
+
+    async def load(self) -> BinaryIO:
+        return BytesIO(self.data.encode("utf-8"))
+
+    async def watch(self, callback: Callable[[], Exception | None]) -> Exception | None:
+        # Block until stop is called
+        await self._block_event.wait()
+        return None
+
+    def stop(self) -> None:
+        self.stop_called = True
+        self._block_event.set()
+
+    def __str__(self) -> str:
+        return "stoppable-data-source"
+
+
+@pytest.fixture
+def empty_async_service() -> AsyncService:
+    """Provide an AsyncService with no data loaded."""
+    return AsyncService()
+
+
 class TestAsyncService:
     """Tests for AsyncService."""
 
-    @pytest.mark.asyncio
     async def test_load_from_async_data_source(self) -> None:
         """Test loading data from an async data source."""
         source = AsyncFakeDataSource(data=create_test_data_json())
@@ -44,7 +115,27 @@ class TestAsyncService:
         assert service.is_healthy()
         assert service.is_ready()
 
-    @pytest.mark.asyncio
+    async def test_load_from_memoryview(self) -> None:
+        """Test loading from a source that returns a memoryview."""
+        data = create_test_data_json().encode("utf-8")
+        source = PayloadDataSource(lambda: memoryview(data))
+        service = AsyncService()
+
+        await service.load_from_data_source(source)
+
+        assert service.get_version().employee_count == 2
+
+    async def test_load_from_file_like(self) -> None:
+        """Test loading from a source that returns a file-like object."""
+        payload = BytesIO(create_test_data_json().encode("utf-8"))
+        source = PayloadDataSource(lambda: payload)
+        service = AsyncService()
+
+        await service.load_from_data_source(source)
+
+        assert service.get_version().employee_count == 2
+        assert payload.closed
+
     async def test_get_employee_by_uid(self) -> None:
         """Test getting an employee by UID."""
         source = AsyncFakeDataSource(data=create_test_data_json())
@@ -56,7 +147,6 @@ class TestAsyncService:
         assert employee.uid == "testuser1"
         assert employee.full_name == "Test User One"
 
-    @pytest.mark.asyncio
     async def test_get_employee_by_email(self) -> None:
         """Test getting an employee by email."""
         source = AsyncFakeDataSource(data=create_test_data_json())
@@ -67,7 +157,6 @@ class TestAsyncService:
         assert employee is not None
         assert employee.uid == "testuser1"
 
-    @pytest.mark.asyncio
     async def test_get_employee_by_slack_id(self) -> None:
         """Test getting an employee by Slack ID."""
         source = AsyncFakeDataSource(data=create_test_data_json())
@@ -78,7 +167,6 @@ class TestAsyncService:
         assert employee is not None
         assert employee.uid == "testuser1"
 
-    @pytest.mark.asyncio
     async def test_get_team_by_name(self) -> None:
         """Test getting a team by name."""
         source = AsyncFakeDataSource(data=create_test_data_json())
@@ -89,7 +177,6 @@ class TestAsyncService:
         assert team is not None
         assert team.name == "test-squad"
 
-    @pytest.mark.asyncio
     async def test_get_all_employees(self) -> None:
         """Test getting all employees."""
         source = AsyncFakeDataSource(data=create_test_data_json())
@@ -99,7 +186,6 @@ class TestAsyncService:
         employees = await service.get_all_employees()
         assert len(employees) == 2
 
-    @pytest.mark.asyncio
     async def test_get_team_members(self) -> None:
         """Test getting team members."""
         source = AsyncFakeDataSource(data=create_test_data_json())
@@ -109,7 +195,6 @@ class TestAsyncService:
         members = await service.get_team_members("test-squad")
         assert len(members) == 2
 
-    @pytest.mark.asyncio
     async def test_get_user_teams(self) -> None:
         """Test getting user teams."""
         source = AsyncFakeDataSource(data=create_test_data_json())
@@ -119,7 +204,6 @@ class TestAsyncService:
         teams = await service.get_user_teams("testuser1")
         assert "test-squad" in teams
 
-    @pytest.mark.asyncio
     async def test_invalid_json_raises_error(self) -> None:
         """Test that invalid JSON raises DataLoadError."""
         source = AsyncFakeDataSource(data='{"invalid": json}')
@@ -128,7 +212,6 @@ class TestAsyncService:
         with pytest.raises(DataLoadError):
             await service.load_from_data_source(source)
 
-    @pytest.mark.asyncio
     async def test_load_error_raises_data_load_error(self) -> None:
         """Test that load errors are wrapped in DataLoadError."""
         source = AsyncFakeDataSource(load_error=OSError("Connection failed"))
@@ -137,14 +220,12 @@ class TestAsyncService:
         with pytest.raises(DataLoadError, match="Connection failed"):
             await service.load_from_data_source(source)
 
-    @pytest.mark.asyncio
     async def test_health_check_without_data(self) -> None:
         """Test health check without data loaded."""
         service = AsyncService()
         assert not service.is_healthy()
         assert not service.is_ready()
 
-    @pytest.mark.asyncio
     async def test_concurrent_reads(self) -> None:
         """Test concurrent read operations are safe."""
         source = AsyncFakeDataSource(data=create_test_data_json())
@@ -163,7 +244,18 @@ class TestAsyncService:
         # Should complete without errors
         assert service.is_healthy()
 
-    @pytest.mark.asyncio
+    async def test_reads_do_not_wait_for_load_lock(self) -> None:
+        """Test lookups are served while a load holds the lock."""
+        source = AsyncFakeDataSource(data=create_test_data_json())
+        service = AsyncService()
+        await service.load_from_data_source(source)
+
+        async with service._lock:
+            employee = await asyncio.wait_for(
+                service.get_employee_by_uid("testuser1"), timeout=1
+            )
+        assert employee is not None
+
     async def test_get_employee_by_github_id(self) -> None:
         """Test getting an employee by GitHub ID."""
         source = AsyncFakeDataSource(data=create_test_data_json())
@@ -174,7 +266,6 @@ class TestAsyncService:
         assert employee is not None
         assert employee.uid == "testuser1"
 
-    @pytest.mark.asyncio
     async def test_get_org_by_name(self) -> None:
         """Test getting an organization by name."""
         source = AsyncFakeDataSource(data=create_test_data_json())
@@ -185,7 +276,6 @@ class TestAsyncService:
         assert org is not None
         assert org.name == "test-division"
 
-    @pytest.mark.asyncio
     async def test_get_pillar_by_name(self) -> None:
         """Test getting a pillar by name returns None when not found."""
         source = AsyncFakeDataSource(data=create_test_data_json())
@@ -196,7 +286,6 @@ class TestAsyncService:
         pillar = await service.get_pillar_by_name("nonexistent-pillar")
         assert pillar is None
 
-    @pytest.mark.asyncio
     async def test_get_team_group_by_name(self) -> None:
         """Test getting a team group by name returns None when not found."""
         source = AsyncFakeDataSource(data=create_test_data_json())
@@ -207,7 +296,6 @@ class TestAsyncService:
         team_group = await service.get_team_group_by_name("nonexistent-team-group")
         assert team_group is None
 
-    @pytest.mark.asyncio
     async def test_get_user_organizations(self) -> None:
         """Test getting user organizations by Slack ID."""
         source = AsyncFakeDataSource(data=create_test_data_json())
@@ -221,7 +309,6 @@ class TestAsyncService:
         orgs2 = await service.get_user_organizations("U999999")
         assert orgs2 == []
 
-    @pytest.mark.asyncio
     async def test_get_all_teams(self) -> None:
         """Test getting all teams."""
         source = AsyncFakeDataSource(data=create_test_data_json())
@@ -231,7 +318,6 @@ class TestAsyncService:
         teams = await service.get_all_teams()
         assert len(teams) > 0
 
-    @pytest.mark.asyncio
     async def test_get_all_orgs(self) -> None:
         """Test getting all orgs."""
         source = AsyncFakeDataSource(data=create_test_data_json())
@@ -241,7 +327,6 @@ class TestAsyncService:
         orgs = await service.get_all_orgs()
         assert len(orgs) > 0
 
-    @pytest.mark.asyncio
     async def test_get_all_pillars(self) -> None:
         """Test getting all pillars (empty in test data)."""
         source = AsyncFakeDataSource(data=create_test_data_json())
@@ -252,7 +337,6 @@ class TestAsyncService:
         # Test data doesn't have pillars
         assert isinstance(pillars, list)
 
-    @pytest.mark.asyncio
     async def test_get_all_team_groups(self) -> None:
         """Test getting all team groups (empty in test data)."""
         source = AsyncFakeDataSource(data=create_test_data_json())
@@ -263,7 +347,6 @@ class TestAsyncService:
         # Test data doesn't have team groups
         assert isinstance(team_groups, list)
 
-    @pytest.mark.asyncio
     async def test_get_org_members(self) -> None:
         """Test getting org members."""
         source = AsyncFakeDataSource(data=create_test_data_json())
@@ -273,7 +356,6 @@ class TestAsyncService:
         members = await service.get_org_members("test-division")
         assert isinstance(members, list)
 
-    @pytest.mark.asyncio
     async def test_get_version(self) -> None:
         """Test getting version info (sync method on async service)."""
         source = AsyncFakeDataSource(data=create_test_data_json())
@@ -285,7 +367,6 @@ class TestAsyncService:
         assert version.employee_count == 2
         assert version.org_count > 0
 
-    @pytest.mark.asyncio
     async def test_initialize_with_data_source(self) -> None:
         """Test initializing service with data source."""
         source = AsyncFakeDataSource(data=create_test_data_json())
@@ -295,7 +376,6 @@ class TestAsyncService:
         assert service.is_healthy()
         assert service.is_ready()
 
-    @pytest.mark.asyncio
     async def test_queries_without_data(self) -> None:
         """Test that queries return None/empty without data loaded."""
         service = AsyncService()
@@ -336,7 +416,6 @@ class TestAsyncService:
         assert await service.get_teams_by_jira_component("TEST", "Core") == []
         assert await service.get_jira_ownership_for_team("test") == []
 
-    @pytest.mark.asyncio
     async def test_get_manager_for_employee(self) -> None:
         """Test getting an employee's manager."""
         source = AsyncFakeDataSource(data=create_test_data_json())
@@ -351,7 +430,6 @@ class TestAsyncService:
         manager2 = await service.get_manager_for_employee("testuser2")
         assert manager2 is None
 
-    @pytest.mark.asyncio
     async def test_get_teams_for_uid(self) -> None:
         """Test getting teams for a UID."""
         source = AsyncFakeDataSource(data=create_test_data_json())
@@ -361,7 +439,6 @@ class TestAsyncService:
         teams = await service.get_teams_for_uid("testuser1")
         assert "test-squad" in teams
 
-    @pytest.mark.asyncio
     async def test_get_teams_for_slack_id(self) -> None:
         """Test getting teams for a Slack ID."""
         source = AsyncFakeDataSource(data=create_test_data_json())
@@ -375,7 +452,6 @@ class TestAsyncService:
         teams2 = await service.get_teams_for_slack_id("U999999")
         assert teams2 == []
 
-    @pytest.mark.asyncio
     async def test_is_employee_in_team(self) -> None:
         """Test checking if employee is in team."""
         source = AsyncFakeDataSource(data=create_test_data_json())
@@ -386,7 +462,6 @@ class TestAsyncService:
         assert await service.is_employee_in_team("testuser1", "nonexistent") is False
         assert await service.is_employee_in_team("nonexistent", "test-squad") is False
 
-    @pytest.mark.asyncio
     async def test_is_slack_user_in_team(self) -> None:
         """Test checking if Slack user is in team."""
         source = AsyncFakeDataSource(data=create_test_data_json())
@@ -397,7 +472,6 @@ class TestAsyncService:
         assert await service.is_slack_user_in_team("U111111", "nonexistent") is False
         assert await service.is_slack_user_in_team("U999999", "test-squad") is False
 
-    @pytest.mark.asyncio
     async def test_is_employee_in_org(self) -> None:
         """Test checking if employee is in org."""
         source = AsyncFakeDataSource(data=create_test_data_json())
@@ -407,7 +481,6 @@ class TestAsyncService:
         assert await service.is_employee_in_org("testuser1", "test-division") is True
         assert await service.is_employee_in_org("testuser1", "nonexistent") is False
 
-    @pytest.mark.asyncio
     async def test_is_slack_user_in_org(self) -> None:
         """Test checking if Slack user is in org."""
         source = AsyncFakeDataSource(data=create_test_data_json())
@@ -417,7 +490,6 @@ class TestAsyncService:
         assert await service.is_slack_user_in_org("U111111", "test-division") is True
         assert await service.is_slack_user_in_org("U999999", "test-division") is False
 
-    @pytest.mark.asyncio
     async def test_get_all_employee_uids(self) -> None:
         """Test getting all employee UIDs."""
         source = AsyncFakeDataSource(data=create_test_data_json())
@@ -429,7 +501,6 @@ class TestAsyncService:
         assert "testuser1" in uids
         assert "testuser2" in uids
 
-    @pytest.mark.asyncio
     async def test_get_all_pillar_names(self) -> None:
         """Test getting all pillar names."""
         source = AsyncFakeDataSource(data=create_test_data_json())
@@ -439,7 +510,6 @@ class TestAsyncService:
         names = await service.get_all_pillar_names()
         assert "test-pillar" in names
 
-    @pytest.mark.asyncio
     async def test_get_all_team_group_names(self) -> None:
         """Test getting all team group names."""
         source = AsyncFakeDataSource(data=create_test_data_json())
@@ -449,7 +519,6 @@ class TestAsyncService:
         names = await service.get_all_team_group_names()
         assert "test-team-group" in names
 
-    @pytest.mark.asyncio
     async def test_get_hierarchy_path(self) -> None:
         """Test getting hierarchy path for an entity."""
         source = AsyncFakeDataSource(data=create_test_data_json())
@@ -461,7 +530,6 @@ class TestAsyncService:
         assert path[0].name == "test-squad"
         assert path[0].type == "team"
 
-    @pytest.mark.asyncio
     async def test_get_descendants_tree(self) -> None:
         """Test getting descendants tree for an entity."""
         source = AsyncFakeDataSource(data=create_test_data_json())
@@ -473,7 +541,6 @@ class TestAsyncService:
         assert tree.name == "test-division"
         assert tree.type == "org"
 
-    @pytest.mark.asyncio
     async def test_get_component_by_name(self) -> None:
         """Test getting a component by name."""
         source = AsyncFakeDataSource(data=create_test_data_json())
@@ -487,7 +554,6 @@ class TestAsyncService:
         # Nonexistent
         assert await service.get_component_by_name("nonexistent") is None
 
-    @pytest.mark.asyncio
     async def test_get_all_components(self) -> None:
         """Test getting all components."""
         source = AsyncFakeDataSource(data=create_test_data_json())
@@ -498,7 +564,6 @@ class TestAsyncService:
         assert len(components) == 1
         assert components[0].name == "test-component"
 
-    @pytest.mark.asyncio
     async def test_get_jira_projects(self) -> None:
         """Test getting all Jira projects."""
         source = AsyncFakeDataSource(data=create_test_data_json())
@@ -509,7 +574,6 @@ class TestAsyncService:
         assert "TEST" in projects
         assert "PLAT" in projects
 
-    @pytest.mark.asyncio
     async def test_get_jira_components(self) -> None:
         """Test getting Jira components for a project."""
         source = AsyncFakeDataSource(data=create_test_data_json())
@@ -523,7 +587,6 @@ class TestAsyncService:
         # Nonexistent project
         assert await service.get_jira_components("NONEXISTENT") == []
 
-    @pytest.mark.asyncio
     async def test_get_teams_by_jira_project(self) -> None:
         """Test getting teams that own a Jira project."""
         source = AsyncFakeDataSource(data=create_test_data_json())
@@ -534,7 +597,6 @@ class TestAsyncService:
         assert len(teams) > 0
         assert any(t.name == "test-squad" for t in teams)
 
-    @pytest.mark.asyncio
     async def test_get_teams_by_jira_component(self) -> None:
         """Test getting teams that own a Jira component."""
         source = AsyncFakeDataSource(data=create_test_data_json())
@@ -548,7 +610,6 @@ class TestAsyncService:
         # Nonexistent
         assert await service.get_teams_by_jira_component("TEST", "Nonexistent") == []
 
-    @pytest.mark.asyncio
     async def test_get_jira_ownership_for_team(self) -> None:
         """Test getting Jira ownership for a team."""
         source = AsyncFakeDataSource(data=create_test_data_json())
@@ -563,11 +624,12 @@ class TestAsyncService:
         # Nonexistent team
         assert await service.get_jira_ownership_for_team("nonexistent") == []
 
-    @pytest.mark.asyncio
-    async def test_start_watcher_returns_immediately(self) -> None:
+    async def test_start_watcher_returns_immediately(
+        self, empty_async_service: AsyncService
+    ) -> None:
         """Test that start_data_source_watcher returns immediately."""
         source = AsyncFakeDataSource(data=create_test_data_json())
-        service = AsyncService()
+        service = empty_async_service
 
         # This should return immediately, not block
         await service.start_data_source_watcher(source)
@@ -579,35 +641,12 @@ class TestAsyncService:
         # Clean up
         await service.stop_watcher()
 
-    @pytest.mark.asyncio
-    async def test_stop_watcher_cancels_task(self) -> None:
+    async def test_stop_watcher_cancels_task(
+        self, empty_async_service: AsyncService
+    ) -> None:
         """Test that stop_watcher() cancels the watcher task."""
-
-        class BlockingDataSource:
-            """Data source with a blocking watch for testing."""
-
-            def __init__(self, data: str) -> None:
-                self.data = data
-                self._stop_event = asyncio.Event()
-
-            async def load(self) -> BinaryIO:
-                return BytesIO(self.data.encode("utf-8"))
-
-            async def watch(
-                self, callback: Callable[[], Exception | None]
-            ) -> Exception | None:
-                # Block until cancelled
-                try:
-                    await self._stop_event.wait()
-                except asyncio.CancelledError:
-                    pass
-                return None
-
-            def __str__(self) -> str:
-                return "blocking-data-source"
-
         source = BlockingDataSource(data=create_test_data_json())
-        service = AsyncService()
+        service = empty_async_service
 
         # Start watcher
         await service.start_data_source_watcher(source)
@@ -624,11 +663,12 @@ class TestAsyncService:
         assert service._watcher_task is None
         assert not service._watcher_running
 
-    @pytest.mark.asyncio
-    async def test_watcher_already_running_raises_error(self) -> None:
+    async def test_watcher_already_running_raises_error(
+        self, empty_async_service: AsyncService
+    ) -> None:
         """Test that starting a watcher when one is running raises error."""
         source = AsyncFakeDataSource(data=create_test_data_json())
-        service = AsyncService()
+        service = empty_async_service
 
         await service.start_data_source_watcher(source)
 
@@ -638,38 +678,12 @@ class TestAsyncService:
         # Clean up
         await service.stop_watcher()
 
-    @pytest.mark.asyncio
-    async def test_stop_watcher_calls_source_stop(self) -> None:
+    async def test_stop_watcher_calls_source_stop(
+        self, empty_async_service: AsyncService
+    ) -> None:
         """Test that stop_watcher() calls source.stop() if available."""
-        stop_called = False
-
-        class StoppableDataSource:
-            """Data source with a stop() method for testing."""
-
-            def __init__(self, data: str) -> None:
-                self.data = data
-                self._block_event = asyncio.Event()
-
-            async def load(self) -> BinaryIO:
-                return BytesIO(self.data.encode("utf-8"))
-
-            async def watch(
-                self, callback: Callable[[], Exception | None]
-            ) -> Exception | None:
-                # Block until stop is called
-                await self._block_event.wait()
-                return None
-
-            def stop(self) -> None:
-                nonlocal stop_called
-                stop_called = True
-                self._block_event.set()
-
-            def __str__(self) -> str:
-                return "stoppable-data-source"
-
         source = StoppableDataSource(data=create_test_data_json())
-        service = AsyncService()
+        service = empty_async_service
 
         await service.start_data_source_watcher(source)
 
@@ -678,6 +692,6 @@ class TestAsyncService:
 
         await service.stop_watcher()
 
-        assert stop_called, "source.stop() should have been called"
+        assert source.stop_called, "source.stop() should have been called"
         assert service._watcher_task is None
         assert not service._watcher_running
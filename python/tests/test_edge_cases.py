@@ -1,11 +1,17 @@
 """Tests for edge cases and error handling."""
 
+import itertools
 import json
+import os
+import queue
 import tempfile
 import threading
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, tzinfo
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
 import pytest
 
@@ -15,6 +21,22 @@ from orgdatacore._exceptions import DataLoadError
 # Import from internal testing module - NOT part of public API
 from orgdatacore._internal.testing import FileDataSource
 
+# Per-thread iteration count for the concurrency tests. Thread-safety signal
+# saturates well below 100 iterations, so default runs stay small; the soak
+# variant below keeps the original load and is opt-in via ``-m soak``.
+ITERS = int(os.environ.get("ORGDATA_CONCURRENT_ITERS", "20"))
+SOAK_ITERS = 100
+
+_T = TypeVar("_T")
+
+
+def _drain(q: queue.SimpleQueue[_T]) -> list[_T]:
+    """Return everything currently in ``q`` (call only after producers join)."""
+    items: list[_T] = []
+    while not q.empty():
+        items.append(q.get_nowait())
+    return items
+
 
 class TestServiceWithNoData:
     """Tests for service behavior before data is loaded."""
@@ -65,22 +87,25 @@ class TestServiceErrorHandling:
 
     def test_empty_string_handling(self, service: Service):
         """Test that empty string parameters are handled correctly."""
-        assert service.get_employee_by_uid("") is None
-        assert service.get_employee_by_slack_id("") is None
-        assert service.get_employee_by_github_id("") is None
-        assert service.get_team_by_name("") is None
-        assert service.get_org_by_name("") is None
+        lookups = (
+            service.get_employee_by_uid,
+            service.get_employee_by_slack_id,
+            service.get_employee_by_github_id,
+            service.get_team_by_name,
+            service.get_org_by_name,
+        )
+        failing = [f.__name__ for f in lookups if f("") is not None]
+        assert not failing, f"Expected None for empty string from: {failing}"
 
     def test_nonexistent_data_handling(self, service: Service):
         """Test that nonexistent data queries return safe defaults."""
-        teams = service.get_teams_for_uid("nonexistent")
-        assert len(teams) == 0
-
-        members = service.get_team_members("nonexistent-team")
-        assert len(members) == 0
-
-        orgs = service.get_user_organizations("U99999999")
-        assert len(orgs) == 0
+        queries = (
+            (service.get_teams_for_uid, "nonexistent"),
+            (service.get_team_members, "nonexistent-team"),
+            (service.get_user_organizations, "U99999999"),
+        )
+        failing = [f.__name__ for f, arg in queries if len(f(arg)) != 0]
+        assert not failing, f"Expected empty results from: {failing}"
 
     def test_special_characters_in_ids(self, service: Service):
         """Test that special characters in IDs don't cause crashes."""
@@ -91,66 +116,75 @@ class TestServiceErrorHandling:
         service.is_employee_in_team("user-123", "team_456")
 
 
+@pytest.mark.slow
 class TestConcurrentAccess:
     """Tests for thread safety of the service."""
 
-    def test_concurrent_reads(self, service: Service) -> None:
-        """Test that concurrent reads are safe."""
-        results: list[int] = []
-        errors: list[Exception] = []
-
-        def reader(thread_id: int) -> None:
-            try:
-                for _ in range(100):
-                    service.get_employee_by_uid("jsmith")
-                    service.get_team_by_name("test-team")
-                    service.is_employee_in_team("jsmith", "test-team")
-                    service.get_version()
-                    service.get_user_organizations("U12345678")
-                results.append(thread_id)
-            except Exception as e:
-                errors.append(e)
+    @staticmethod
+    def _run_concurrent_reads(service: Service, iters: int) -> None:
+        def reader(thread_id: int) -> int:
+            for _ in range(iters):
+                service.get_employee_by_uid("jsmith")
+                service.get_team_by_name("test-team")
+                service.is_employee_in_team("jsmith", "test-team")
+                service.get_version()
+                service.get_user_organizations("U12345678")
+            return thread_id
 
-        threads = [threading.Thread(target=reader, args=(i,)) for i in range(10)]
+        # map() re-raises the first reader exception when results are consumed
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            results = list(executor.map(reader, range(10), timeout=5))
 
-        for t in threads:
-            t.start()
+        assert results == list(range(10))
 
-        for t in threads:
-            t.join(timeout=5)
+    def test_concurrent_reads(self, service: Service) -> None:
+        """Test that concurrent reads are safe."""
+        self._run_concurrent_reads(service, ITERS)
 
-        assert len(errors) == 0, f"Errors occurred: {errors}"
-        assert len(results) == 10
+    @pytest.mark.soak
+    def test_concurrent_reads_soak(self, service: Service) -> None:
+        """Soak variant of test_concurrent_reads at the full iteration count."""
+        self._run_concurrent_reads(service, SOAK_ITERS)
 
-    def test_concurrent_read_write(self, test_data_path: Path) -> None:
+    def test_concurrent_read_write(self, file_source: FileDataSource) -> None:
         """Test that concurrent reads and writes are safe."""
         service = Service()
-        file_source = FileDataSource(str(test_data_path))
 
         # Initial load
         service.load_from_data_source(file_source)
 
-        results: list[str] = []
-        errors: list[Exception] = []
+        results: queue.SimpleQueue[str] = queue.SimpleQueue()
+        errors: queue.SimpleQueue[Exception] = queue.SimpleQueue()
+
+        writer_started = threading.Event()
+        writer_done = threading.Event()
 
         def reader() -> None:
             try:
-                for _ in range(100):
+                assert writer_started.wait(timeout=5), "writer never started"
+                # Keep reading until the writer finishes so reads interleave
+                # with every reload
+                while True:
                     service.get_employee_by_uid("jsmith")
                     service.get_team_members("test-team")
-                    time.sleep(0.001)
-                results.append("reader")
+                    if writer_done.is_set():
+                        break
+                    # Yield so ten spinning readers cannot starve the writer
+                    time.sleep(0)
+                results.put("reader")
             except Exception as e:
-                errors.append(e)
+                errors.put(e)
 
         def writer() -> None:
             try:
+                writer_started.set()
                 for _ in range(5):
-                    time.sleep(0.05)
                     service.load_from_data_source(file_source)
-                results.append("writer")
+                results.put("writer")
             except Exception as e:
-                errors.append(e)
+                errors.put(e)
+            finally:
+                writer_done.set()
 
         # Start 10 readers and 1 writer
         threads = [threading.Thread(target=reader) for _ in range(10)]
@@ -162,14 +196,28 @@ class TestConcurrentAccess:
         for t in threads:
             t.join(timeout=10)
 
-        assert len(errors) == 0, f"Errors occurred: {errors}"
+        assert errors.empty(), f"Errors occurred: {_drain(errors)}"
+        assert Counter(_drain(results)) == Counter(reader=10, writer=1)
 
 
+@pytest.mark.slow
 class TestReloadData:
     """Tests for data reloading."""
 
-    def test_reload_data(self, test_data_path: Path):
+    def test_reload_data(
+        self, file_source: FileDataSource, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test that data can be reloaded."""
+        ticks = itertools.count()
+
+        class _SteppingClock(datetime):
+            """Advances one second per now() call so load times always differ."""
+
+            @classmethod
+            def now(cls, tz: tzinfo | None = None) -> "_SteppingClock":
+                return cls(2024, 1, 1, tzinfo=tz) + timedelta(seconds=next(ticks))
+
+        monkeypatch.setattr("orgdatacore._service.datetime", _SteppingClock)
         service = Service()
 
         # Initial state - no data
@@ -177,7 +225,6 @@ class TestReloadData:
         assert version1.employee_count == 0
 
         # Load data for the first time
-        file_source = FileDataSource(str(test_data_path))
         service.load_from_data_source(file_source)
 
         version2 = service.get_version()
@@ -185,7 +232,6 @@ class TestReloadData:
         assert version2.load_time > version1.load_time
 
         # Reload the same data
-        time.sleep(0.001)  # Ensure time difference
         service.load_from_data_source(file_source)
 
         version3 = service.get_version()
@@ -197,42 +243,59 @@ class TestReloadData:
         assert emp is not None
 
 
+@pytest.fixture(scope="module")
+def enum_lists(service: Service) -> dict[str, list[str]]:
+    """Enumeration results of the shared service, fetched once per module."""
+    return {
+        "uids": service.get_all_employee_uids(),
+        "teams": service.get_all_team_names(),
+        "orgs": service.get_all_org_names(),
+        "pillars": service.get_all_pillar_names(),
+        "team_groups": service.get_all_team_group_names(),
+    }
+
+
+@pytest.fixture(scope="module")
+def enum_sets(enum_lists: dict[str, list[str]]) -> dict[str, frozenset[str]]:
+    """The enumeration results materialized once as sets."""
+    return {key: frozenset(names) for key, names in enum_lists.items()}
+
+
 class TestEnumerationMethods:
     """Tests for enumeration methods."""
 
-    def test_get_all_employee_uids(self, service: Service):
+    def test_get_all_employee_uids(self, enum_sets: dict[str, frozenset[str]]):
         """Test getting all employee UIDs."""
-        uids = service.get_all_employee_uids()
-        assert len(uids) == 3
-        assert "jsmith" in uids
-        assert "adoe" in uids
-        assert "bwilson" in uids
+        assert enum_sets["uids"] == {"jsmith", "adoe", "bwilson"}
 
-    def test_get_all_team_names(self, service: Service):
+    def test_get_all_team_names(self, enum_sets: dict[str, frozenset[str]]):
         """Test getting all team names."""
-        names = service.get_all_team_names()
-        assert len(names) == 2
-        assert "test-team" in names
-        assert "platform-team" in names
+        assert enum_sets["teams"] == {"test-team", "platform-team"}
 
-    def test_get_all_org_names(self, service: Service):
+    def test_get_all_org_names(self, enum_sets: dict[str, frozenset[str]]):
         """Test getting all organization names."""
-        names = service.get_all_org_names()
-        assert len(names) == 2
-        assert "test-org" in names
-        assert "platform-org" in names
+        assert enum_sets["orgs"] == {"test-org", "platform-org"}
 
-    def test_get_all_pillar_names(self, service: Service):
+    def test_get_all_pillar_names(self, enum_sets: dict[str, frozenset[str]]):
         """Test getting all pillar names."""
-        names = service.get_all_pillar_names()
-        assert len(names) == 1
-        assert "engineering" in names
+        assert enum_sets["pillars"] == {"engineering"}
 
-    def test_get_all_team_group_names(self, service: Service):
+    def test_get_all_team_group_names(self, enum_sets: dict[str, frozenset[str]]):
         """Test getting all team group names."""
-        names = service.get_all_team_group_names()
-        assert len(names) == 1
-        assert "backend-teams" in names
+        assert enum_sets["team_groups"] == {"backend-teams"}
+
+    def test_enumeration_has_no_duplicates(
+        self,
+        enum_lists: dict[str, list[str]],
+        enum_sets: dict[str, frozenset[str]],
+    ):
+        """Enumeration lists should not repeat names."""
+        duplicated = [
+            key
+            for key, names in enum_lists.items()
+            if len(names) != len(enum_sets[key])
+        ]
+        assert duplicated == []
 
     def test_enumeration_with_no_data(self, empty_service: Service):
         """Test enumeration methods with no data loaded."""
@@ -261,18 +324,13 @@ class TestWatcherState:
         assert not service._watcher_running
         assert service._stop_event.is_set()
 
-    def test_watcher_already_running_raises_error(self, test_data_path: Path):
+    def test_watcher_already_running_raises_error(self, file_source: FileDataSource):
         """Test that starting watcher when already running raises error."""
         service = Service()
         service._watcher_running = True
 
-        file_source = FileDataSource(str(test_data_path))
-
-        try:
+        with pytest.raises(RuntimeError, match="already running"):
             service.start_data_source_watcher(file_source)
-            assert False, "Should have raised RuntimeError"
-        except RuntimeError as e:
-            assert "already running" in str(e)
 
 
 class TestDataValidation:
@@ -1,104 +1,114 @@
 """Tests for employee-related functionality."""
 
-import pytest
-
 from orgdatacore import Employee, Service
 
+from ._factories import make_synthetic_data
+
+# (uid, expected employee)
+EMPLOYEE_BY_UID_CASES: list[tuple[str, Employee | None]] = [
+    (
+        "jsmith",
+        Employee(
+            uid="jsmith",
+            full_name="John Smith",
+            email="jsmith@example.com",
+            job_title="Software Engineer",
+            slack_uid="U12345678",
+            github_id="jsmith-dev",
+            manager_uid="adoe",
+            timezone="America/New_York",
+        ),
+    ),
+    (
+        "adoe",
+        Employee(
+            uid="adoe",
+            full_name="Alice Doe",
+            email="adoe@example.com",
+            job_title="Team Lead",
+            slack_uid="U87654321",
+            github_id="alice-codes",
+            is_people_manager=True,
+            timezone="America/Los_Angeles",
+        ),
+    ),
+    ("nonexistent", None),
+    ("", None),
+]
+
+# (slack_id, expected uid)
+EMPLOYEE_BY_SLACK_ID_CASES: list[tuple[str, str | None]] = [
+    ("U12345678", "jsmith"),
+    ("U87654321", "adoe"),
+    ("U98765432", "bwilson"),
+    ("U99999999", None),
+    ("", None),
+]
+
+# (github_id, expected uid)
+EMPLOYEE_BY_GITHUB_ID_CASES: list[tuple[str, str | None]] = [
+    ("jsmith-dev", "jsmith"),
+    ("alice-codes", "adoe"),
+    ("bobw", "bwilson"),
+    ("hackerx", None),
+    ("", None),
+]
+
+# (uid, slack_id)
+SLACK_ID_PAIRS: list[tuple[str, str]] = [
+    ("jsmith", "U12345678"),
+    ("adoe", "U87654321"),
+    ("bwilson", "U98765432"),
+]
+
+# (uid, github_id)
+GITHUB_ID_PAIRS: list[tuple[str, str]] = [
+    ("jsmith", "jsmith-dev"),
+    ("adoe", "alice-codes"),
+    ("bwilson", "bobw"),
+]
+
+# (uid, expected manager uid)
+MANAGER_CASES: list[tuple[str, str | None]] = [
+    ("jsmith", "adoe"),  # jsmith's manager is adoe
+    ("bwilson", None),  # bwilson has no manager
+    ("adoe", None),  # adoe has no manager
+    ("nonexistent", None),
+    ("", None),
+]
+
+
+def _uid_of(employee: Employee | None) -> str | None:
+    return employee.uid if employee is not None else None
+
 
 class TestGetEmployeeByUID:
     """Tests for employee lookup by UID."""
 
-    @pytest.mark.parametrize(
-        "uid,expected",
-        [
-            (
-                "jsmith",
-                Employee(
-                    uid="jsmith",
-                    full_name="John Smith",
-                    email="jsmith@example.com",
-                    job_title="Software Engineer",
-                    slack_uid="U12345678",
-                    github_id="jsmith-dev",
-                    manager_uid="adoe",
-                    timezone="America/New_York",
-                ),
-            ),
-            (
-                "adoe",
-                Employee(
-                    uid="adoe",
-                    full_name="Alice Doe",
-                    email="adoe@example.com",
-                    job_title="Team Lead",
-                    slack_uid="U87654321",
-                    github_id="alice-codes",
-                    is_people_manager=True,
-                    timezone="America/Los_Angeles",
-                ),
-            ),
-            ("nonexistent", None),
-            ("", None),
-        ],
-    )
-    def test_get_employee_by_uid(
-        self, service: Service, uid: str, expected: Employee | None
-    ):
+    def test_get_employee_by_uid(self, service: Service):
         """Test employee lookup by UID."""
-        result = service.get_employee_by_uid(uid)
-        assert result == expected
+        for uid, expected in EMPLOYEE_BY_UID_CASES:
+            assert service.get_employee_by_uid(uid) == expected, uid
 
 
 class TestGetEmployeeBySlackID:
     """Tests for employee lookup by Slack ID."""
 
-    @pytest.mark.parametrize(
-        "slack_id,expected_uid",
-        [
-            ("U12345678", "jsmith"),
-            ("U87654321", "adoe"),
-            ("U98765432", "bwilson"),
-            ("U99999999", None),
-            ("", None),
-        ],
-    )
-    def test_get_employee_by_slack_id(
-        self, service: Service, slack_id: str, expected_uid: str | None
-    ):
+    def test_get_employee_by_slack_id(self, service: Service):
         """Test employee lookup by Slack ID."""
-        result = service.get_employee_by_slack_id(slack_id)
-
-        if expected_uid is None:
-            assert result is None
-        else:
-            assert result is not None
-            assert result.uid == expected_uid
+        for slack_id, expected_uid in EMPLOYEE_BY_SLACK_ID_CASES:
+            result = service.get_employee_by_slack_id(slack_id)
+            assert _uid_of(result) == expected_uid, slack_id
 
 
 class TestGetEmployeeByGitHubID:
     """Tests for employee lookup by GitHub ID."""
 
-    @pytest.mark.parametrize(
-        "github_id,expected_uid",
-        [
-            ("jsmith-dev", "jsmith"),
-            ("alice-codes", "adoe"),
-            ("bobw", "bwilson"),
-            ("hackerx", None),
-            ("", None),
-        ],
-    )
-    def test_get_employee_by_github_id(
-        self, service: Service, github_id: str, expected_uid: str | None
-    ):
+    def test_get_employee_by_github_id(self, service: Service):
         """Test employee lookup by GitHub ID."""
-        result = service.get_employee_by_github_id(github_id)
-
-        if expected_uid is None:
-            assert result is None
-        else:
-            assert result is not None
-            assert result.uid == expected_uid
+        for github_id, expected_uid in EMPLOYEE_BY_GITHUB_ID_CASES:
+            result = service.get_employee_by_github_id(github_id)
+            assert _uid_of(result) == expected_uid, github_id
 
 
 class TestEmployeeFields:
@@ -120,55 +130,33 @@ class TestEmployeeFields:
 class TestSlackIDMapping:
     """Tests for bidirectional Slack ID mapping."""
 
-    @pytest.mark.parametrize(
-        "uid,slack_id",
-        [
-            ("jsmith", "U12345678"),
-            ("adoe", "U87654321"),
-            ("bwilson", "U98765432"),
-        ],
-    )
-    def test_bidirectional_mapping(self, service: Service, uid: str, slack_id: str):
+    def test_bidirectional_mapping(self, service: Service):
         """Test UID <-> Slack ID mapping consistency."""
-        # Test UID -> Employee -> SlackID
-        emp = service.get_employee_by_uid(uid)
-        assert emp is not None
-        assert emp.slack_uid == slack_id
-
-        # Test SlackID -> Employee -> UID
-        emp_by_slack = service.get_employee_by_slack_id(slack_id)
-        assert emp_by_slack is not None
-        assert emp_by_slack.uid == uid
+        for uid, slack_id in SLACK_ID_PAIRS:
+            # Test UID -> Employee -> SlackID
+            emp = service.get_employee_by_uid(uid)
+            assert emp is not None, uid
+            assert emp.slack_uid == slack_id
 
-        # Ensure they're the same employee
-        assert emp == emp_by_slack
+            # Test SlackID -> Employee -> UID, and that it's the same employee
+            emp_by_slack = service.get_employee_by_slack_id(slack_id)
+            assert emp_by_slack == emp, slack_id
 
 
 class TestGitHubIDMapping:
     """Tests for bidirectional GitHub ID mapping."""
 
-    @pytest.mark.parametrize(
-        "uid,github_id",
-        [
-            ("jsmith", "jsmith-dev"),
-            ("adoe", "alice-codes"),
-            ("bwilson", "bobw"),
-        ],
-    )
-    def test_bidirectional_mapping(self, service: Service, uid: str, github_id: str):
+    def test_bidirectional_mapping(self, service: Service):
         """Test UID <-> GitHub ID mapping consistency."""
-        # Test UID -> Employee -> GitHubID
-        emp = service.get_employee_by_uid(uid)
-        assert emp is not None
-        assert emp.github_id == github_id
-
-        # Test GitHubID -> Employee -> UID
-        emp_by_github = service.get_employee_by_github_id(github_id)
-        assert emp_by_github is not None
-        assert emp_by_github.uid == uid
+        for uid, github_id in GITHUB_ID_PAIRS:
+            # Test UID -> Employee -> GitHubID
+            emp = service.get_employee_by_uid(uid)
+            assert emp is not None, uid
+            assert emp.github_id == github_id
 
-        # Ensure they're the same employee
-        assert emp == emp_by_github
+            # Test GitHubID -> Employee -> UID, and that it's the same employee
+            emp_by_github = service.get_employee_by_github_id(github_id)
+            assert emp_by_github == emp, github_id
 
 
 class TestNewEmployeeFields:
@@ -176,38 +164,18 @@ class TestNewEmployeeFields:
 
     def test_new_employee_fields(self):
         """Test that new employee fields are properly handled."""
-        from orgdatacore import (
-            Data,
-            GitHubIDMappings,
-            Indexes,
-            Lookups,
-            MembershipIndex,
-            SlackIDMappings,
-        )
-
         service = Service()
-        service._data = Data(
-            lookups=Lookups(
-                employees={
-                    "testuser": Employee(
-                        uid="testuser",
-                        full_name="Test User",
-                        email="test@example.com",
-                        job_title="Engineer",
-                        slack_uid="U123",
-                        github_id="testgithub",
-                        rhat_geo="NA",
-                        cost_center=12345,
-                        manager_uid="manager1",
-                        is_people_manager=False,
-                    ),
-                },
-            ),
-            indexes=Indexes(
-                membership=MembershipIndex(),
-                slack_id_mappings=SlackIDMappings(),
-                github_id_mappings=GitHubIDMappings(),
-            ),
+        service._data = make_synthetic_data(
+            uid="testuser",
+            full_name="Test User",
+            email="test@example.com",
+            job_title="Engineer",
+            slack_uid="U123",
+            github_id="testgithub",
+            rhat_geo="NA",
+            cost_center=12345,
+            manager_uid="manager1",
+            is_people_manager=False,
         )
 
         emp = service.get_employee_by_uid("testuser")
@@ -223,24 +191,8 @@ class TestNewEmployeeFields:
 class TestGetManagerForEmployee:
     """Tests for manager lookup functionality."""
 
-    @pytest.mark.parametrize(
-        "uid,expected_manager_uid",
-        [
-            ("jsmith", "adoe"),  # jsmith's manager is adoe
-            ("bwilson", None),  # bwilson has no manager
-            ("adoe", None),  # adoe has no manager
-            ("nonexistent", None),
-            ("", None),
-        ],
-    )
-    def test_get_manager_for_employee(
-        self, service: Service, uid: str, expected_manager_uid: str | None
-    ):
+    def test_get_manager_for_employee(self, service: Service):
         """Test manager lookup for employees."""
-        result = service.get_manager_for_employee(uid)
-
-        if expected_manager_uid is None:
-            assert result is None
-        else:
-            assert result is not None
-            assert result.uid == expected_manager_uid
+        for uid, expected_manager_uid in MANAGER_CASES:
+            result = service.get_manager_for_employee(uid)
+            assert _uid_of(result) == expected_manager_uid, uid
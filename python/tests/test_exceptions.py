@@ -15,28 +15,22 @@ from orgdatacore._exceptions import FileSourceError
 class TestExceptionHierarchy:
     """Test the exception class hierarchy."""
 
-    def test_data_load_error_is_org_data_error(self):
-        """DataLoadError should be a subclass of OrgDataError."""
-        assert issubclass(DataLoadError, OrgDataError)
-        assert issubclass(DataLoadError, Exception)
-
-    def test_data_source_error_is_org_data_error(self):
-        """DataSourceError should be a subclass of OrgDataError."""
-        assert issubclass(DataSourceError, OrgDataError)
-
-    def test_gcs_error_is_data_source_error(self):
-        """GCSError should be a subclass of DataSourceError."""
-        assert issubclass(GCSError, DataSourceError)
-        assert issubclass(GCSError, OrgDataError)
-
-    def test_file_source_error_is_data_source_error(self):
-        """FileSourceError should be a subclass of DataSourceError."""
-        assert issubclass(FileSourceError, DataSourceError)
-        assert issubclass(FileSourceError, OrgDataError)
-
-    def test_configuration_error_is_org_data_error(self):
-        """ConfigurationError should be a subclass of OrgDataError."""
-        assert issubclass(ConfigurationError, OrgDataError)
+    # (exception, expected base class)
+    HIERARCHY: list[tuple[type[Exception], type[Exception]]] = [
+        (OrgDataError, Exception),
+        (DataLoadError, OrgDataError),
+        (DataSourceError, OrgDataError),
+        (GCSError, DataSourceError),
+        (GCSError, OrgDataError),
+        (FileSourceError, DataSourceError),
+        (FileSourceError, OrgDataError),
+        (ConfigurationError, OrgDataError),
+    ]
+
+    def test_hierarchy(self):
+        """Each exception should be a subclass of its documented base."""
+        for sub, base in self.HIERARCHY:
+            assert issubclass(sub, base), f"{sub.__name__} is not a {base.__name__}"
 
 
 class TestCatchingExceptions:
@@ -1,6 +1,7 @@
 """Tests for GCS data source functionality using fake implementations."""
 
 import importlib.util
+from datetime import timedelta
 
 import pytest
 
@@ -8,6 +9,8 @@ from orgdatacore import Service
 from orgdatacore._exceptions import ConfigurationError, GCSError
 from orgdatacore._gcs import GCSDataSource, _retry_with_backoff
 from orgdatacore._internal.testing import (
+    FakeBlob,
+    FakeBucket,
     FakeGCSClient,
     FakeGCSDataSource,
     create_test_data_json,
@@ -16,6 +19,17 @@ from orgdatacore._types import GCSConfig
 
 _has_gcs = importlib.util.find_spec("google.cloud.storage") is not None
 
+# Encoded once per module; FakeGCSDataSource stores bytes as-is.
+_TEST_DATA_JSON = create_test_data_json().encode("utf-8")
+
+# Read-only source over the static test data, shared by the tests below.
+# Tests that call update_content() must build their own source.
+_STATIC_SOURCE = FakeGCSDataSource(
+    bucket="org-data",
+    object_path="comprehensive_index_dump.json",
+    content=_TEST_DATA_JSON,
+)
+
 
 @pytest.mark.skipif(not _has_gcs, reason="google-cloud-storage not installed")
 class TestGCSDataSourceInit:
@@ -40,6 +54,46 @@ class TestGCSDataSourceInit:
             GCSDataSource(config)
 
 
+def _staged_blob(
+    bucket: FakeBucket, name: str, content: bytes, generation: int = 1
+) -> FakeBlob:
+    """Add a blob to ``bucket`` and return a reference with metadata loaded."""
+    bucket.add_blob(name, content, generation=generation)
+    blob = bucket.blob(name)
+    blob.reload()
+    return blob
+
+
+@pytest.fixture(scope="module")
+def gcs_client() -> FakeGCSClient:
+    """Fake GCS client with a "test-bucket", shared by the tests in this module.
+
+    Tests must use names from ``blob_name``/``bucket_name`` (or their own
+    unique names) so they never observe each other's blobs or buckets.
+    """
+    client = FakeGCSClient()
+    client.add_bucket("test-bucket")
+    return client
+
+
+@pytest.fixture
+def gcs_bucket(gcs_client: FakeGCSClient) -> FakeBucket:
+    """The shared "test-bucket"."""
+    return gcs_client.bucket("test-bucket")
+
+
+@pytest.fixture
+def blob_name(request: pytest.FixtureRequest) -> str:
+    """Object name unique to the requesting test."""
+    return f"{request.node.name}.json"
+
+
+@pytest.fixture
+def bucket_name(request: pytest.FixtureRequest) -> str:
+    """Bucket name unique to the requesting test."""
+    return f"{request.node.name}-bucket"
+
+
 class TestFakeGCSClient:
     """Tests for the fake GCS client implementation."""
 
@@ -53,55 +107,46 @@ class TestFakeGCSClient:
         client = FakeGCSClient.from_service_account_json("/path/to/key.json")
         assert client.project == "fake-project-from-json"
 
-    def test_bucket_creation(self) -> None:
+    def test_bucket_creation(self, gcs_client: FakeGCSClient, bucket_name: str) -> None:
         """Test getting a bucket reference."""
-        client = FakeGCSClient()
-        bucket = client.bucket("my-bucket")
-        assert bucket.name == "my-bucket"
+        bucket = gcs_client.bucket(bucket_name)
+        assert bucket.name == bucket_name
 
-    def test_bucket_caching(self) -> None:
+    def test_bucket_caching(self, gcs_client: FakeGCSClient, bucket_name: str) -> None:
         """Test that bucket references are cached."""
-        client = FakeGCSClient()
-        bucket1 = client.bucket("my-bucket")
-        bucket2 = client.bucket("my-bucket")
+        bucket1 = gcs_client.bucket(bucket_name)
+        bucket2 = gcs_client.bucket(bucket_name)
         assert bucket1 is bucket2
 
-    def test_add_bucket(self) -> None:
+    def test_add_bucket(self, gcs_client: FakeGCSClient, bucket_name: str) -> None:
         """Test adding a bucket."""
-        client = FakeGCSClient()
-        bucket = client.add_bucket("new-bucket")
-        assert bucket.name == "new-bucket"
-        assert client.bucket("new-bucket") is bucket
+        bucket = gcs_client.add_bucket(bucket_name)
+        assert bucket.name == bucket_name
+        assert gcs_client.bucket(bucket_name) is bucket
 
 
 class TestFakeBucket:
     """Tests for the fake bucket implementation."""
 
-    def test_blob_creation(self) -> None:
+    def test_blob_creation(self, gcs_bucket: FakeBucket) -> None:
         """Test creating a blob reference."""
-        client = FakeGCSClient()
-        bucket = client.add_bucket("test-bucket")
-        blob = bucket.blob("path/to/file.json")
+        blob = gcs_bucket.blob("path/to/file.json")
         assert blob.name == "path/to/file.json"
 
-    def test_add_blob(self) -> None:
+    def test_add_blob(self, gcs_bucket: FakeBucket, blob_name: str) -> None:
         """Test adding a blob with content."""
-        client = FakeGCSClient()
-        bucket = client.add_bucket("test-bucket")
-        bucket.add_blob("test.json", b'{"key": "value"}')
+        gcs_bucket.add_blob(blob_name, b'{"key": "value"}')
 
-        blob = bucket.blob("test.json")
+        blob = gcs_bucket.blob(blob_name)
         assert blob.download_as_bytes() == b'{"key": "value"}'
 
-    def test_update_blob(self) -> None:
+    def test_update_blob(self, gcs_bucket: FakeBucket, blob_name: str) -> None:
         """Test updating blob content."""
-        client = FakeGCSClient()
-        bucket = client.add_bucket("test-bucket")
-        bucket.add_blob("test.json", b"original", generation=1)
+        gcs_bucket.add_blob(blob_name, b"original", generation=1)
 
-        bucket.update_blob("test.json", b"updated")
+        gcs_bucket.update_blob(blob_name, b"updated")
 
-        blob = bucket.blob("test.json")
+        blob = gcs_bucket.blob(blob_name)
         blob.reload()
         assert blob.download_as_bytes() == b"updated"
         assert blob.generation == 2
@@ -110,66 +155,54 @@ class TestFakeBucket:
 class TestFakeBlob:
     """Tests for the fake blob implementation."""
 
-    def test_download_as_bytes(self) -> None:
+    def test_download_as_bytes(self, gcs_bucket: FakeBucket, blob_name: str) -> None:
         """Test downloading blob content."""
-        client = FakeGCSClient()
-        bucket = client.add_bucket("test-bucket")
-        bucket.add_blob("test.json", b"test content")
+        gcs_bucket.add_blob(blob_name, b"test content")
 
-        blob = bucket.blob("test.json")
+        blob = gcs_bucket.blob(blob_name)
         content = blob.download_as_bytes()
         assert content == b"test content"
 
-    def test_download_nonexistent_raises(self) -> None:
+    def test_download_nonexistent_raises(
+        self, gcs_bucket: FakeBucket, blob_name: str
+    ) -> None:
         """Test that downloading nonexistent blob raises exception."""
-        client = FakeGCSClient()
-        bucket = client.add_bucket("test-bucket")
-        blob = bucket.blob("nonexistent.json")
+        blob = gcs_bucket.blob(blob_name)
 
         with pytest.raises(Exception, match="not found"):
             blob.download_as_bytes()
 
-    def test_reload(self) -> None:
+    def test_reload(self, gcs_bucket: FakeBucket, blob_name: str) -> None:
         """Test reloading blob metadata."""
-        client = FakeGCSClient()
-        bucket = client.add_bucket("test-bucket")
-        bucket.add_blob("test.json", b"content", generation=5)
-
-        blob = bucket.blob("test.json")
-        blob.reload()
+        blob = _staged_blob(gcs_bucket, blob_name, b"content", generation=5)
         assert blob.generation == 5
 
-    def test_reload_nonexistent_raises(self) -> None:
+    def test_reload_nonexistent_raises(
+        self, gcs_bucket: FakeBucket, blob_name: str
+    ) -> None:
         """Test that reloading nonexistent blob raises exception."""
-        client = FakeGCSClient()
-        bucket = client.add_bucket("test-bucket")
-        blob = bucket.blob("nonexistent.json")
+        blob = gcs_bucket.blob(blob_name)
 
         with pytest.raises(Exception, match="not found"):
             blob.reload()
 
-    def test_upload_from_string(self) -> None:
+    def test_upload_from_string(self, gcs_bucket: FakeBucket, blob_name: str) -> None:
         """Test uploading content to blob."""
-        client = FakeGCSClient()
-        bucket = client.add_bucket("test-bucket")
-        bucket.add_blob("test.json", b"original")
+        gcs_bucket.add_blob(blob_name, b"original")
 
-        blob = bucket.blob("test.json")
+        blob = gcs_bucket.blob(blob_name)
         blob.upload_from_string("new content")
 
         assert blob.download_as_bytes() == b"new content"
 
-    def test_generation_increments_on_update(self) -> None:
+    def test_generation_increments_on_update(
+        self, gcs_bucket: FakeBucket, blob_name: str
+    ) -> None:
         """Test that generation increments when blob is updated."""
-        client = FakeGCSClient()
-        bucket = client.add_bucket("test-bucket")
-        bucket.add_blob("test.json", b"v1", generation=1)
-
-        blob = bucket.blob("test.json")
-        blob.reload()
+        blob = _staged_blob(gcs_bucket, blob_name, b"v1")
         initial_gen = blob.generation
 
-        bucket.update_blob("test.json", b"v2")
+        gcs_bucket.update_blob(blob_name, b"v2")
         blob.reload()
 
         assert blob.generation == initial_gen + 1
@@ -180,13 +213,7 @@ class TestFakeGCSDataSource:
 
     def test_load(self) -> None:
         """Test loading data from fake GCS."""
-        source = FakeGCSDataSource(
-            bucket="test-bucket",
-            object_path="data.json",
-            content=create_test_data_json(),
-        )
-
-        reader = source.load()
+        reader = _STATIC_SOURCE.load()
         content = reader.read()
         assert b"testuser1" in content
 
@@ -219,19 +246,14 @@ class TestFakeGCSDataSource:
         assert b'"version": 2' in reader.read()
 
 
+@pytest.mark.slow
 class TestFakeGCSWithService:
     """Integration tests using fake GCS with the Service."""
 
     def test_service_load_from_fake_gcs(self) -> None:
         """Test loading service data from fake GCS."""
-        source = FakeGCSDataSource(
-            bucket="org-data",
-            object_path="comprehensive_index_dump.json",
-            content=create_test_data_json(),
-        )
-
         service = Service()
-        service.load_from_data_source(source)
+        service.load_from_data_source(_STATIC_SOURCE)
 
         assert service.is_healthy()
         assert service.is_ready()
@@ -242,21 +264,15 @@ class TestFakeGCSWithService:
 
     def test_service_hot_reload_from_fake_gcs(self) -> None:
         """Test hot reloading service data from fake GCS."""
-        # Create initial data with 2 employees
-        source = FakeGCSDataSource(
-            bucket="org-data",
-            object_path="data.json",
-            content=create_test_data_json(),
-        )
-
+        # Initial data has 2 employees
         service = Service()
-        service.load_from_data_source(source)
+        service.load_from_data_source(_STATIC_SOURCE)
 
         version1 = service.get_version()
         assert version1.employee_count == 2
 
         # Reload with same data
-        service.load_from_data_source(source)
+        service.load_from_data_source(_STATIC_SOURCE)
 
         version2 = service.get_version()
         assert version2.employee_count == 2
@@ -266,6 +282,13 @@ class TestFakeGCSWithService:
 class TestRetryWithBackoff:
     """Tests for the retry with backoff utility."""
 
+    @pytest.fixture(autouse=True)
+    def sleeps(self, monkeypatch: pytest.MonkeyPatch) -> list[float]:
+        """Replace the backoff sleep with a recorder so tests never wait."""
+        delays: list[float] = []
+        monkeypatch.setattr("orgdatacore._gcs.time.sleep", delays.append)
+        return delays
+
     def test_successful_operation(self) -> None:
         """Test that successful operation returns immediately."""
         call_count = 0
@@ -279,7 +302,7 @@ class TestRetryWithBackoff:
         assert result == b"success"
         assert call_count == 1
 
-    def test_retry_on_failure(self) -> None:
+    def test_retry_on_failure(self, sleeps: list[float]) -> None:
         """Test that operation is retried on failure."""
         call_count = 0
 
@@ -290,18 +313,20 @@ class TestRetryWithBackoff:
                 raise Exception("Transient error")
             return b"success"
 
-        result = _retry_with_backoff(operation, max_retries=3, initial_delay=0.01)
+        result = _retry_with_backoff(operation, max_retries=3, initial_delay=1.0)
         assert result == b"success"
         assert call_count == 3
+        assert sleeps == [1.0, 2.0]
 
-    def test_exhausted_retries_raises(self) -> None:
+    def test_exhausted_retries_raises(self, sleeps: list[float]) -> None:
         """Test that GCSError is raised when retries are exhausted."""
 
         def operation():
             raise Exception("Persistent error")
 
         with pytest.raises(GCSError, match="failed after"):
-            _retry_with_backoff(operation, max_retries=2, initial_delay=0.01)
+            _retry_with_backoff(operation, max_retries=2, initial_delay=1.0)
+        assert sleeps == [1.0, 2.0]
 
 
 class TestGCSConfig:
@@ -317,8 +342,6 @@ class TestGCSConfig:
 
     def test_config_with_all_options(self) -> None:
         """Test configuration with all options."""
-        from datetime import timedelta
-
         config = GCSConfig(
             bucket="my-bucket",
             object_path="path/to/data.json",
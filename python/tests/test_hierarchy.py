@@ -1,7 +1,12 @@
 """Tests for hierarchy traversal methods."""
 
+import copy
+import pickle
+
 from orgdatacore import HierarchyPathEntry, Service
 
+from ._factories import make_synthetic_data
+
 
 class TestGetHierarchyPath:
     """Tests for get_hierarchy_path method."""
@@ -92,6 +97,23 @@ class TestGetHierarchyPath:
         path = empty_service.get_hierarchy_path("test-team", "team")
         assert path == []
 
+    def test_get_hierarchy_path_type_case_preserved(self, service: Service) -> None:
+        """Test the first entry echoes the entity type as the caller spelled it."""
+        path = service.get_hierarchy_path("test-team", "Team")
+        assert [(e.name, e.type) for e in path] == [
+            ("test-team", "Team"),
+            ("test-org", "org"),
+        ]
+
+    def test_get_hierarchy_path_follows_replaced_data(
+        self, fresh_service: Service
+    ) -> None:
+        """Test precomputed paths are rebuilt when _data is replaced directly."""
+        assert fresh_service.get_hierarchy_path("test-team", "team") != []
+
+        fresh_service._data = make_synthetic_data()
+        assert fresh_service.get_hierarchy_path("test-team", "team") == []
+
 
 class TestGetDescendantsTree:
     """Tests for get_descendants_tree method."""
@@ -160,9 +182,7 @@ class TestGetDescendantsTree:
         assert tree is not None
 
         # Find platform-org in children
-        platform_org = next(
-            (c for c in tree.children if c.name == "platform-org"), None
-        )
+        platform_org = tree.children_by_name.get("platform-org")
         assert platform_org is not None
 
         # Navigate to platform-team
@@ -176,7 +196,34 @@ class TestGetDescendantsTree:
         assert platform_team.name == "platform-team"
         assert len(platform_team.children) == 0
 
+    def test_get_descendants_tree_children_by_name(self, service: Service) -> None:
+        """Test children_by_name indexes exactly the direct children."""
+        tree = service.get_descendants_tree("test-org")
+        assert tree is not None
+        assert list(tree.children_by_name) == [c.name for c in tree.children]
+        for child in tree.children:
+            assert tree.children_by_name[child.name] is child
+        assert "platform-team" not in tree.children_by_name
+
+    def test_descendants_tree_copyable_after_children_by_name(
+        self, service: Service
+    ) -> None:
+        """Test reading children_by_name leaves the node picklable and copyable."""
+        tree = service.get_descendants_tree("test-org")
+        assert tree is not None
+        assert tree.children_by_name
+
+        assert pickle.loads(pickle.dumps(tree)) == tree
+        assert copy.deepcopy(tree) == tree
+        assert tree.model_copy(deep=True) == tree
+
     def test_get_descendants_tree_no_data(self, empty_service: Service) -> None:
         """Test get_descendants_tree returns None when no data loaded."""
         tree = empty_service.get_descendants_tree("test-org")
         assert tree is None
+
+    def test_get_descendants_tree_is_cached(self, service: Service) -> None:
+        """Test repeated queries for the same root share one built tree."""
+        tree = service.get_descendants_tree("test-org")
+        assert tree is not None
+        assert service.get_descendants_tree("test-org") is tree
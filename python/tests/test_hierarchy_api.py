@@ -2,7 +2,7 @@
 
 import pytest
 
-from orgdatacore import Service
+from orgdatacore import HierarchyNode, Service
 
 
 class TestHierarchyPathAPI:
@@ -110,28 +110,25 @@ class TestDescendantsTreeAPI:
 
     def test_descendants_tree_structure(self, service: Service) -> None:
         """Descendants tree should have valid structure."""
-        from orgdatacore import HierarchyNode
-
         orgs = service.get_all_org_names()
         tree = service.get_descendants_tree(orgs[0])
         if not tree:
             pytest.skip(f"No tree for {orgs[0]}")
 
-        def validate_node(node: HierarchyNode, visited: set[str] | None = None) -> None:
-            if visited is None:
-                visited = set()
-
-            assert node.name not in visited, f"Cycle detected at {node.name}"
+        # One visited set for the whole walk: in a well-formed tree every
+        # entity appears exactly once, which also rules out cycles.
+        visited: set[str] = set()
+        stack: list[HierarchyNode] = [tree]
+        while stack:
+            node = stack.pop()
+            assert node.name not in visited, f"Duplicate or cycle at {node.name}"
             visited.add(node.name)
 
             assert isinstance(node.name, str)
             assert isinstance(node.type, str)
             assert isinstance(node.children, (list, tuple))
 
-            for child in node.children:
-                validate_node(child, visited.copy())
-
-        validate_node(tree)
+            stack.extend(node.children)
 
     def test_nonexistent_entity_returns_none(self, service: Service) -> None:
         """Nonexistent entity should return None."""
@@ -143,17 +140,18 @@ class TestHierarchyConsistency:
     """Tests for consistency between hierarchy APIs."""
 
     def test_parent_child_consistency(self, service: Service) -> None:
-        """Parent in hierarchy path should list entity as child in descendants."""
+        """A team's parent should list the team as a child in descendants."""
+        # Parent links come from the team itself; no per-team path query
         for team_name in service.get_all_team_names():
-            path = service.get_hierarchy_path(team_name, "team")
-            if len(path) < 2:
+            team = service.get_team_by_name(team_name)
+            assert team is not None
+            if not team.parent:
                 continue
 
-            parent_entry = path[1]
-            parent_tree = service.get_descendants_tree(parent_entry.name)
+            parent_name = team.parent.name
+            parent_tree = service.get_descendants_tree(parent_name)
 
             if parent_tree:
-                child_names = [c.name for c in parent_tree.children]
-                assert team_name in child_names, (
-                    f"Team {team_name} not in parent {parent_entry.name}'s children"
+                assert team_name in parent_tree.children_by_name, (
+                    f"Team {team_name} not in parent {parent_name}'s children"
                 )
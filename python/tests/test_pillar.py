@@ -1,5 +1,7 @@
 """Tests for pillar-related functionality."""
 
+import pytest
+
 from orgdatacore import (
     Data,
     GitHubIDMappings,
@@ -14,92 +16,61 @@ from orgdatacore import (
 )
 
 
+@pytest.fixture(scope="module")
+def pillar_service() -> Service:
+    """Service holding two pillars, built once for this module.
+
+    Shared by every test here, so tests must treat it as read-only.
+    """
+    service = Service()
+    service._data = Data(
+        lookups=Lookups(
+            pillars={
+                "Engineering": Pillar(
+                    uid="pillar1",
+                    name="Engineering",
+                    type="pillar",
+                    group=Group(
+                        type=GroupType(name="pillar"),
+                        resolved_people_uid_list=("user1", "user2"),
+                    ),
+                ),
+                "Product": Pillar(
+                    uid="pillar2",
+                    name="Product",
+                ),
+            },
+        ),
+        indexes=Indexes(
+            membership=MembershipIndex(),
+            slack_id_mappings=SlackIDMappings(),
+            github_id_mappings=GitHubIDMappings(),
+        ),
+    )
+    return service
+
+
 class TestGetPillarByName:
     """Tests for pillar lookup by name."""
 
-    def test_get_existing_pillar(self):
+    def test_get_existing_pillar(self, pillar_service: Service):
         """Test that an existing pillar can be retrieved."""
-        service = Service()
-        service._data = Data(
-            lookups=Lookups(
-                pillars={
-                    "Engineering": Pillar(
-                        uid="pillar1",
-                        name="Engineering",
-                        type="pillar",
-                        group=Group(
-                            type=GroupType(name="pillar"),
-                            resolved_people_uid_list=("user1", "user2"),
-                        ),
-                    ),
-                },
-            ),
-            indexes=Indexes(
-                membership=MembershipIndex(),
-                slack_id_mappings=SlackIDMappings(),
-                github_id_mappings=GitHubIDMappings(),
-            ),
-        )
-
-        result = service.get_pillar_by_name("Engineering")
+        result = pillar_service.get_pillar_by_name("Engineering")
         assert result is not None
         assert result.uid == "pillar1"
 
-    def test_get_nonexistent_pillar(self):
+    def test_get_nonexistent_pillar(self, pillar_service: Service):
         """Test that getting a nonexistent pillar returns None."""
-        service = Service()
-        service._data = Data(
-            lookups=Lookups(
-                pillars={
-                    "Engineering": Pillar(
-                        uid="pillar1",
-                        name="Engineering",
-                        type="pillar",
-                        group=Group(
-                            type=GroupType(name="pillar"),
-                            resolved_people_uid_list=("user1", "user2"),
-                        ),
-                    ),
-                },
-            ),
-            indexes=Indexes(
-                membership=MembershipIndex(),
-                slack_id_mappings=SlackIDMappings(),
-                github_id_mappings=GitHubIDMappings(),
-            ),
-        )
-
-        result = service.get_pillar_by_name("Nonexistent")
+        result = pillar_service.get_pillar_by_name("Nonexistent")
         assert result is None
 
 
 class TestGetAllPillarNames:
     """Tests for getting all pillar names."""
 
-    def test_get_all_pillar_names(self):
+    def test_get_all_pillar_names(self, pillar_service: Service):
         """Test that all pillar names are returned."""
-        service = Service()
-        service._data = Data(
-            lookups=Lookups(
-                pillars={
-                    "Engineering": Pillar(
-                        uid="pillar1",
-                        name="Engineering",
-                    ),
-                    "Product": Pillar(
-                        uid="pillar2",
-                        name="Product",
-                    ),
-                },
-            ),
-            indexes=Indexes(
-                membership=MembershipIndex(),
-                slack_id_mappings=SlackIDMappings(),
-                github_id_mappings=GitHubIDMappings(),
-            ),
-        )
-
-        names = service.get_all_pillar_names()
+        names = pillar_service.get_all_pillar_names()
         assert len(names) == 2
         assert "Engineering" in names
         assert "Product" in names
@@ -1,5 +1,6 @@
 """Tests for the Service class - service initialization and data loading."""
 
+import json
 from datetime import datetime
 from pathlib import Path
 
@@ -40,10 +41,8 @@ class TestNewService:
         assert version.employee_count == 0
         assert version.org_count == 0
 
-    def test_constructor_injection(self, test_data_path: Path) -> None:
+    def test_constructor_injection(self, file_source: FileDataSource) -> None:
         """Service should support constructor injection of data source (keyword-only)."""
-        file_source = FileDataSource(str(test_data_path))
-
         # Constructor injection - must use keyword argument
         service = Service(data_source=file_source)
 
@@ -57,68 +56,77 @@ class TestNewService:
         assert emp.full_name == "John Smith"
 
 
-class TestServiceInterface:
-    """Tests to ensure Service implements ServiceInterface."""
+# load_time of a service that has never loaded data
+_DT_MIN = datetime.min
 
-    def test_service_implements_interface(self, service: Service):
-        """Service should implement all required interface methods."""
-        # Core data access methods
-        assert hasattr(service, "get_employee_by_uid")
-        assert hasattr(service, "get_employee_by_slack_id")
-        assert hasattr(service, "get_employee_by_github_id")
-        assert hasattr(service, "get_manager_for_employee")
-        assert hasattr(service, "get_team_by_name")
-        assert hasattr(service, "get_org_by_name")
-        assert hasattr(service, "get_pillar_by_name")
-        assert hasattr(service, "get_team_group_by_name")
+_INVALID_JSON_SOURCE = FakeDataSource(data='{"invalid": json}')
 
+# Methods every Service must expose, grouped as in the interface
+REQUIRED_SERVICE_METHODS = frozenset(
+    {
+        # Core data access methods
+        "get_employee_by_uid",
+        "get_employee_by_slack_id",
+        "get_employee_by_github_id",
+        "get_manager_for_employee",
+        "get_team_by_name",
+        "get_org_by_name",
+        "get_pillar_by_name",
+        "get_team_group_by_name",
         # Membership queries
-        assert hasattr(service, "get_teams_for_uid")
-        assert hasattr(service, "get_teams_for_slack_id")
-        assert hasattr(service, "get_team_members")
-        assert hasattr(service, "is_employee_in_team")
-        assert hasattr(service, "is_slack_user_in_team")
-
+        "get_teams_for_uid",
+        "get_teams_for_slack_id",
+        "get_team_members",
+        "is_employee_in_team",
+        "is_slack_user_in_team",
         # Organization queries
-        assert hasattr(service, "is_employee_in_org")
-        assert hasattr(service, "is_slack_user_in_org")
-        assert hasattr(service, "get_user_organizations")
-
+        "is_employee_in_org",
+        "is_slack_user_in_org",
+        "get_user_organizations",
         # Data management
-        assert hasattr(service, "get_version")
-        assert hasattr(service, "load_from_data_source")
-        assert hasattr(service, "start_data_source_watcher")
-
+        "get_version",
+        "load_from_data_source",
+        "start_data_source_watcher",
         # Enumeration methods
-        assert hasattr(service, "get_all_employee_uids")
-        assert hasattr(service, "get_all_team_names")
-        assert hasattr(service, "get_all_org_names")
-        assert hasattr(service, "get_all_pillar_names")
-        assert hasattr(service, "get_all_team_group_names")
+        "get_all_employee_uids",
+        "get_all_team_names",
+        "get_all_org_names",
+        "get_all_pillar_names",
+        "get_all_team_group_names",
+    }
+)
+
+
+class TestServiceInterface:
+    """Tests to ensure Service implements ServiceInterface."""
+
+    def test_service_implements_interface(self, service: Service):
+        """Service should implement all required interface methods."""
+        missing = REQUIRED_SERVICE_METHODS.difference(dir(service))
+        assert not missing, f"Service is missing: {sorted(missing)}"
 
 
 class TestLoadFromDataSource:
     """Tests for data loading functionality."""
 
-    def test_load_valid_data_file(self, test_data_path: Path):
-        """Loading a valid data file should succeed."""
+    def test_load_valid_data_file(self, memory_source: FakeDataSource):
+        """Loading valid data should succeed."""
         service = Service()
-        file_source = FileDataSource(str(test_data_path))
 
         # Should not raise
-        service.load_from_data_source(file_source)
+        service.load_from_data_source(memory_source)
 
         version = service.get_version()
         assert version.employee_count == 3
         assert version.org_count == 2
 
-    def test_load_nonexistent_file(self):
+    @pytest.mark.io
+    def test_load_nonexistent_file(
+        self, empty_service: Service, missing_file_source: FileDataSource
+    ):
         """Loading a nonexistent file should raise DataLoadError."""
-        service = Service()
-        file_source = FileDataSource("nonexistent.json")
-
         with pytest.raises(DataLoadError, match="file not found"):
-            service.load_from_data_source(file_source)
+            empty_service.load_from_data_source(missing_file_source)
 
     def test_load_sets_version_info(self, service: Service):
         """Loading data should set version information."""
@@ -126,7 +134,7 @@ class TestLoadFromDataSource:
 
         assert version.employee_count == 3
         assert version.org_count == 2
-        assert version.load_time != datetime.min
+        assert version.load_time != _DT_MIN
 
 
 class TestGetVersion:
@@ -136,7 +144,7 @@ class TestGetVersion:
         """Initial version should have zero/default values."""
         version = empty_service.get_version()
 
-        assert version.load_time == datetime.min
+        assert version.load_time == _DT_MIN
         assert version.employee_count == 0
         assert version.org_count == 0
 
@@ -151,21 +159,12 @@ class TestGetVersion:
 class TestInvalidJSONHandling:
     """Tests for handling invalid JSON data."""
 
-    def test_invalid_json_raises_error(self, empty_service: Service):
-        """Loading invalid JSON should raise DataLoadError."""
-        invalid_source = FakeDataSource(data='{"invalid": json}')
-
+    def test_invalid_json_raises_and_leaves_service_usable(
+        self, empty_service: Service
+    ):
+        """Loading invalid JSON should raise and leave the service usable."""
         with pytest.raises(DataLoadError):
-            empty_service.load_from_data_source(invalid_source)
-
-    def test_service_usable_after_failed_load(self, empty_service: Service):
-        """Service should still be usable after a failed JSON load."""
-        invalid_source = FakeDataSource(data='{"invalid": json}')
-
-        try:
-            empty_service.load_from_data_source(invalid_source)
-        except DataLoadError:
-            pass
+            empty_service.load_from_data_source(_INVALID_JSON_SOURCE)
 
         # Service should have no data
         assert empty_service.get_employee_by_uid("test") is None
@@ -230,8 +229,6 @@ class TestPIIFreeData:
 
     def test_rejects_pii_free_with_employees(self):
         """Should reject data claiming pii_free but containing employees."""
-        import json
-
         data = {
             "metadata": {"pii_free": True},
             "lookups": {
@@ -247,8 +244,6 @@ class TestPIIFreeData:
 
     def test_rejects_pii_free_with_membership(self):
         """Should reject data claiming pii_free but containing membership data."""
-        import json
-
         data = {
             "metadata": {"pii_free": True},
             "lookups": {"employees": {}, "teams": {}},
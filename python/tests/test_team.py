@@ -1,5 +1,9 @@
 """Tests for team-related functionality."""
 
+from collections import Counter
+from collections.abc import Callable
+from typing import Any
+
 import pytest
 
 from orgdatacore import (
@@ -7,6 +11,7 @@ from orgdatacore import (
     ChannelInfo,
     Data,
     EmailInfo,
+    Employee,
     EscalationContactInfo,
     GitHubIDMappings,
     Group,
@@ -25,33 +30,67 @@ from orgdatacore import (
 )
 
 
-class TestGetTeamByName:
-    """Tests for team lookup by name."""
-
-    @pytest.mark.parametrize(
-        "team_name,expected_found,expected_name",
-        [
-            ("test-team", True, "test-team"),
-            ("platform-team", True, "platform-team"),
-            ("nonexistent-team", False, None),
-            ("", False, None),
-        ],
-    )
-    def test_get_team_by_name(
-        self,
-        service: Service,
-        team_name: str,
-        expected_found: bool,
-        expected_name: str | None,
-    ):
-        """Test team lookup by name."""
-        result = service.get_team_by_name(team_name)
-
-        if expected_found:
-            assert result is not None
-            assert result.name == expected_name
-        else:
-            assert result is None
+def _team_name(team: Team | None) -> str | None:
+    return team.name if team is not None else None
+
+
+def _member_uids(members: list[Employee]) -> Counter[str]:
+    return Counter(emp.uid for emp in members)
+
+
+def _unchanged(result: bool) -> bool:
+    return result
+
+
+# Service query -> how its result is reduced before comparing to expected
+TEAM_QUERY_RESULTS: dict[str, Callable[[Any], object]] = {
+    "get_team_by_name": _team_name,
+    "get_teams_for_uid": Counter,
+    "get_teams_for_slack_id": Counter,
+    "get_team_members": _member_uids,
+    "is_employee_in_team": _unchanged,
+    "is_slack_user_in_team": _unchanged,
+}
+
+# (query, args, expected); expected is compared to the reduced result.
+# Name lists are compared as Counters: order-insensitive, duplicates kept.
+TEAM_QUERY_CASES: list[tuple[str, tuple[str, ...], object]] = [
+    ("get_team_by_name", ("test-team",), "test-team"),
+    ("get_team_by_name", ("platform-team",), "platform-team"),
+    ("get_team_by_name", ("nonexistent-team",), None),
+    ("get_team_by_name", ("",), None),
+    ("get_teams_for_uid", ("jsmith",), Counter(["test-team"])),
+    ("get_teams_for_uid", ("bwilson",), Counter(["platform-team"])),
+    ("get_teams_for_uid", ("nonexistent",), Counter()),
+    ("get_teams_for_slack_id", ("U12345678",), Counter(["test-team"])),  # jsmith
+    ("get_teams_for_slack_id", ("U98765432",), Counter(["platform-team"])),  # bwilson
+    ("get_teams_for_slack_id", ("U99999999",), Counter()),  # nonexistent
+    ("get_team_members", ("test-team",), Counter(["adoe", "jsmith"])),
+    ("get_team_members", ("platform-team",), Counter(["bwilson"])),
+    ("get_team_members", ("nonexistent-team",), Counter()),
+    ("is_employee_in_team", ("jsmith", "test-team"), True),
+    ("is_employee_in_team", ("bwilson", "platform-team"), True),
+    ("is_employee_in_team", ("jsmith", "platform-team"), False),
+    ("is_employee_in_team", ("nonexistent", "test-team"), False),
+    ("is_employee_in_team", ("jsmith", "nonexistent-team"), False),
+    ("is_slack_user_in_team", ("U12345678", "test-team"), True),  # jsmith
+    ("is_slack_user_in_team", ("U98765432", "platform-team"), True),  # bwilson
+    ("is_slack_user_in_team", ("U12345678", "platform-team"), False),  # jsmith
+    ("is_slack_user_in_team", ("U99999999", "test-team"), False),  # nonexistent
+]
+
+
+@pytest.mark.parametrize(
+    "query,args,expected",
+    TEAM_QUERY_CASES,
+    ids=[f"{query}-{'-'.join(args) or 'empty'}" for query, args, _ in TEAM_QUERY_CASES],
+)
+def test_team_query(
+    service: Service, query: str, args: tuple[str, ...], expected: object
+) -> None:
+    """Test team lookups and membership queries against the shared data."""
+    result = getattr(service, query)(*args)
+    assert TEAM_QUERY_RESULTS[query](result) == expected
 
 
 class TestGetTeamsBySlackChannel:
@@ -69,6 +108,16 @@ class TestGetTeamsBySlackChannel:
             ("  #test-team  ", ["test-team"]),
             ("#", []),
         ],
+        ids=[
+            "hash-prefixed",
+            "bare-name",
+            "alerts-channel",
+            "mixed-case",
+            "nonexistent",
+            "empty",
+            "padded",
+            "hash-only",
+        ],
     )
     def test_get_teams_by_slack_channel(
         self,
@@ -78,70 +127,13 @@ class TestGetTeamsBySlackChannel:
     ):
         """Test team lookup by Slack channel name."""
         result = service.get_teams_by_slack_channel(channel)
-        result_names = sorted(t.name for t in result)
-        assert result_names == sorted(expected_names)
-
-
-class TestGetTeamsForUID:
-    """Tests for team membership lookup by UID."""
-
-    @pytest.mark.parametrize(
-        "uid,expected_teams",
-        [
-            ("jsmith", ["test-team"]),
-            ("bwilson", ["platform-team"]),
-            ("nonexistent", []),
-        ],
-    )
-    def test_get_teams_for_uid(
-        self, service: Service, uid: str, expected_teams: list[str]
-    ):
-        """Test team membership lookup by UID."""
-        result = service.get_teams_for_uid(uid)
-
-        assert sorted(result) == sorted(expected_teams)
-
-
-class TestGetTeamsForSlackID:
-    """Tests for team membership lookup by Slack ID."""
-
-    @pytest.mark.parametrize(
-        "slack_id,expected_teams",
-        [
-            ("U12345678", ["test-team"]),  # jsmith
-            ("U98765432", ["platform-team"]),  # bwilson
-            ("U99999999", []),  # nonexistent
-        ],
-    )
-    def test_get_teams_for_slack_id(
-        self, service: Service, slack_id: str, expected_teams: list[str]
-    ):
-        """Test team membership lookup by Slack ID."""
-        result = service.get_teams_for_slack_id(slack_id)
-
-        assert sorted(result) == sorted(expected_teams)
+        result_names = Counter(t.name for t in result)
+        assert result_names == Counter(expected_names)
 
 
 class TestGetTeamMembers:
     """Tests for team member retrieval."""
 
-    @pytest.mark.parametrize(
-        "team_name,expected_uids",
-        [
-            ("test-team", ["jsmith", "adoe"]),
-            ("platform-team", ["bwilson"]),
-            ("nonexistent-team", []),
-        ],
-    )
-    def test_get_team_members(
-        self, service: Service, team_name: str, expected_uids: list[str]
-    ):
-        """Test team member retrieval."""
-        result = service.get_team_members(team_name)
-
-        result_uids = [emp.uid for emp in result]
-        assert sorted(result_uids) == sorted(expected_uids)
-
     def test_team_members_have_all_fields(self, service: Service):
         """Test that returned employees have all fields populated."""
         members = service.get_team_members("test-team")
@@ -152,47 +144,6 @@ class TestGetTeamMembers:
             assert emp.email != ""
 
 
-class TestIsEmployeeInTeam:
-    """Tests for team membership checks."""
-
-    @pytest.mark.parametrize(
-        "uid,team_name,expected",
-        [
-            ("jsmith", "test-team", True),
-            ("bwilson", "platform-team", True),
-            ("jsmith", "platform-team", False),
-            ("nonexistent", "test-team", False),
-            ("jsmith", "nonexistent-team", False),
-        ],
-    )
-    def test_is_employee_in_team(
-        self, service: Service, uid: str, team_name: str, expected: bool
-    ):
-        """Test team membership checks."""
-        result = service.is_employee_in_team(uid, team_name)
-        assert result == expected
-
-
-class TestIsSlackUserInTeam:
-    """Tests for Slack user team membership checks."""
-
-    @pytest.mark.parametrize(
-        "slack_id,team_name,expected",
-        [
-            ("U12345678", "test-team", True),  # jsmith
-            ("U98765432", "platform-team", True),  # bwilson
-            ("U12345678", "platform-team", False),  # jsmith
-            ("U99999999", "test-team", False),  # nonexistent
-        ],
-    )
-    def test_is_slack_user_in_team(
-        self, service: Service, slack_id: str, team_name: str, expected: bool
-    ):
-        """Test Slack user team membership checks."""
-        result = service.is_slack_user_in_team(slack_id, team_name)
-        assert result == expected
-
-
 class TestTeamMembershipConsistency:
     """Tests for consistency between different team queries."""
 
@@ -213,87 +164,93 @@ class TestTeamMembershipConsistency:
             )
 
 
-class TestGroupExtendedFields:
-    """Tests for the extended Group fields added in refactoring."""
-
-    def test_group_extended_fields(self):
-        """Test that extended group fields are properly handled."""
-        service = Service()
-        service._data = Data(
-            lookups=Lookups(
-                teams={
-                    "Backend Team": Team(
-                        uid="team1",
-                        name="Backend Team",
-                        tab_name="Backend",
-                        description="Backend development team",
-                        type="team",
-                        group=Group(
-                            type=GroupType(name="team"),
-                            resolved_people_uid_list=("user1",),
-                            slack=SlackConfig(
-                                channels=(
-                                    ChannelInfo(
-                                        channel="team-backend",
-                                        channel_id="C123",
-                                        description="Main channel",
-                                        types=("team-internal",),
-                                    ),
-                                ),
-                                aliases=(
-                                    AliasInfo(
-                                        alias="@backend-team",
-                                        description="Team alias",
-                                    ),
+@pytest.fixture(scope="module")
+def backend_team_data() -> Data:
+    """Data holding one team with every extended Group field populated."""
+    return Data(
+        lookups=Lookups(
+            teams={
+                "Backend Team": Team(
+                    uid="team1",
+                    name="Backend Team",
+                    tab_name="Backend",
+                    description="Backend development team",
+                    type="team",
+                    group=Group(
+                        type=GroupType(name="team"),
+                        resolved_people_uid_list=("user1",),
+                        slack=SlackConfig(
+                            channels=(
+                                ChannelInfo(
+                                    channel="team-backend",
+                                    channel_id="C123",
+                                    description="Main channel",
+                                    types=("team-internal",),
                                 ),
                             ),
-                            roles=(
-                                RoleInfo(
-                                    people=("manager1",),
-                                    roles=("manager",),
+                            aliases=(
+                                AliasInfo(
+                                    alias="@backend-team",
+                                    description="Team alias",
                                 ),
                             ),
-                            jiras=(
-                                JiraInfo(
-                                    project="BACKEND",
-                                    component="API",
-                                    description="Backend API",
-                                    types=("main",),
-                                ),
+                        ),
+                        roles=(
+                            RoleInfo(
+                                people=("manager1",),
+                                roles=("manager",),
                             ),
-                            repos=(
-                                RepoInfo(
-                                    repo="https://github.com/org/backend",
-                                    description="Main backend repo",
-                                    types=("source",),
-                                ),
+                        ),
+                        jiras=(
+                            JiraInfo(
+                                project="BACKEND",
+                                component="API",
+                                description="Backend API",
+                                types=("main",),
                             ),
-                            keywords=("backend", "api"),
-                            emails=(
-                                EmailInfo(
-                                    address="backend@example.com",
-                                    name="Team Email",
-                                    description="Backend team email",
-                                ),
+                        ),
+                        repos=(
+                            RepoInfo(
+                                repo="https://github.com/org/backend",
+                                description="Main backend repo",
+                                types=("source",),
                             ),
-                            resources=(
-                                ResourceInfo(
-                                    name="Wiki",
-                                    url="https://wiki.example.com",
-                                    description="Team wiki",
-                                ),
+                        ),
+                        keywords=("backend", "api"),
+                        emails=(
+                            EmailInfo(
+                                address="backend@example.com",
+                                name="Team Email",
+                                description="Backend team email",
+                            ),
+                        ),
+                        resources=(
+                            ResourceInfo(
+                                name="Wiki",
+                                url="https://wiki.example.com",
+                                description="Team wiki",
                             ),
-                            component_roles=("/component/path",),
                         ),
+                        component_roles=("/component/path",),
                     ),
-                },
-            ),
-            indexes=Indexes(
-                membership=MembershipIndex(),
-                slack_id_mappings=SlackIDMappings(),
-                github_id_mappings=GitHubIDMappings(),
-            ),
-        )
+                ),
+            },
+        ),
+        indexes=Indexes(
+            membership=MembershipIndex(),
+            slack_id_mappings=SlackIDMappings(),
+            github_id_mappings=GitHubIDMappings(),
+        ),
+    )
+
+
+class TestGroupExtendedFields:
+    """Tests for the extended Group fields added in refactoring."""
+
+    def test_group_extended_fields(self, backend_team_data: Data):
+        """Test that extended group fields are properly handled."""
+        service = Service()
+        service._data = backend_team_data
 
         team = service.get_team_by_name("Backend Team")
         assert team is not None
@@ -0,0 +1,48 @@
+"""Micro-benchmarks for the hot team and employee queries.
+
+Opt-in: needs pytest-benchmark and is deselected by default. Run with
+``pytest -m bench --benchmark-only``.
+"""
+
+import pytest
+
+from orgdatacore import Service
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.bench
+
+
+def test_bench_get_team_members(service: Service, benchmark) -> None:
+    result = benchmark(service.get_team_members, "test-team")
+    assert len(result) == 2
+
+
+def test_bench_get_teams_for_uid(service: Service, benchmark) -> None:
+    result = benchmark(service.get_teams_for_uid, "jsmith")
+    assert result == ["test-team"]
+
+
+def test_bench_is_employee_in_team(service: Service, benchmark) -> None:
+    assert benchmark(service.is_employee_in_team, "jsmith", "test-team")
+
+
+def test_bench_get_employee_by_uid(service: Service, benchmark) -> None:
+    employee = benchmark(service.get_employee_by_uid, "jsmith")
+    assert employee is not None
+
+
+def test_bench_get_descendants_tree(service: Service, benchmark) -> None:
+    # Trees are cached per root, so each round times a cold hierarchy index
+    # and tree build on a fresh Service sharing the loaded Data.
+    def fresh_service() -> tuple[tuple[Service], dict[str, object]]:
+        svc = Service()
+        svc._data = service._data
+        return (svc,), {}
+
+    tree = benchmark.pedantic(
+        lambda svc: svc.get_descendants_tree("test-org"),
+        setup=fresh_service,
+        rounds=50,
+    )
+    assert tree is not None
@@ -10,6 +10,11 @@ from orgdatacore import (
     get_version_dict,
 )
 
+# Supports semver (1.0.0-dev.1) and PEP 440 (1.0.0.dev0) formats
+_VERSION_RE = re.compile(r"^\d+\.\d+\.\d+([-.]?[a-zA-Z0-9.]+)?(\+[a-zA-Z0-9.]+)?$")
+_API_VERSION_RE = re.compile(r"^\d+\.\d+$")
+_MAJOR, _MINOR = (int(part) for part in API_VERSION.split("."))
+
 
 class TestVersion:
     """Tests for version information."""
@@ -20,9 +25,7 @@ class TestVersion:
 
     def test_version_format(self) -> None:
         """__version__ should follow semver or PEP 440 format."""
-        # Supports semver (1.0.0-dev.1) and PEP 440 (1.0.0.dev0) formats
-        pattern = r"^\d+\.\d+\.\d+([-.]?[a-zA-Z0-9.]+)?(\+[a-zA-Z0-9.]+)?$"
-        assert re.match(pattern, __version__), f"Invalid version format: {__version__}"
+        assert _VERSION_RE.match(__version__), f"Invalid version format: {__version__}"
 
     def test_version_info_is_tuple(self) -> None:
         """__version_info__ should be a tuple of 3 integers."""
@@ -37,8 +40,7 @@ class TestVersion:
 
     def test_api_version_format(self) -> None:
         """API_VERSION should be a major.minor string."""
-        pattern = r"^\d+\.\d+$"
-        assert re.match(pattern, API_VERSION), f"Invalid API version: {API_VERSION}"
+        assert _API_VERSION_RE.match(API_VERSION), f"Invalid API version: {API_VERSION}"
 
 
 class TestAPICompatibility:
@@ -50,20 +52,17 @@ class TestAPICompatibility:
 
     def test_compatible_lower_minor(self) -> None:
         """Lower minor version should be compatible."""
-        major = API_VERSION.split(".")[0]
-        assert check_api_compatibility(f"{major}.0")
+        assert check_api_compatibility(f"{_MAJOR}.0")
 
     def test_incompatible_different_major(self) -> None:
         """Different major version should be incompatible."""
-        current_major = int(API_VERSION.split(".")[0])
-        assert not check_api_compatibility(f"{current_major + 1}.0")
-        if current_major > 0:
-            assert not check_api_compatibility(f"{current_major - 1}.0")
+        assert not check_api_compatibility(f"{_MAJOR + 1}.0")
+        if _MAJOR > 0:
+            assert not check_api_compatibility(f"{_MAJOR - 1}.0")
 
     def test_incompatible_higher_minor(self) -> None:
         """Higher minor version should be incompatible."""
-        major, minor = API_VERSION.split(".")
-        assert not check_api_compatibility(f"{major}.{int(minor) + 1}")
+        assert not check_api_compatibility(f"{_MAJOR}.{_MINOR + 1}")
 
     def test_invalid_version_string(self) -> None:
         """Invalid version strings should return False."""